@@ -9,6 +9,10 @@ import sys
 import argparse
 import asyncio
 import logging
+import queue
+import signal
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 
@@ -19,10 +23,12 @@ sys.path.append(str(Path(__file__).parent / 'src'))
 from health_check import start_health_check, stop_health_check
 
 from src.utils.config import load_config, setup_logging, create_example_config
-from src.database.models import DatabaseManager
+from src.database.models import DatabaseManager, compute_title_hash
 from src.collectors.rss_collector import RSSCollector
-from src.processors.summarizer import ArticleSummarizer, TagGenerator
+from src.processors.summarizer import AIProcessor
 from src.slack.bot import AINewsSlackBot
+import httpx
+from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.schedulers.blocking import BlockingScheduler
 from apscheduler.triggers.cron import CronTrigger
 import pytz
@@ -33,7 +39,7 @@ logger = logging.getLogger(__name__)
 class AINewsBot:
     """Main AI News Bot application"""
     
-    def __init__(self, config_path: str = None):
+    def __init__(self, config_path: str = None, scheduler_type: str = "blocking"):
         # Load configuration
         self.config = load_config(config_path)
         
@@ -44,13 +50,40 @@ class AINewsBot:
         db_path = self.config['database']['path']
         self.db = DatabaseManager(db_path)
         
-        self.summarizer = ArticleSummarizer(self.config)
-        self.tag_generator = TagGenerator(self.config)
+        # One pooled HTTP client shared by both OpenAI consumers so the
+        # TLS handshake is paid once per connection, not once per article
+        self._openai_http = httpx.Client(
+            limits=httpx.Limits(max_keepalive_connections=10, keepalive_expiry=60),
+            timeout=60.0
+        )
+        self.ai_processor = AIProcessor(self.config, http_client=self._openai_http,
+                                        db=self.db)
+        self.summarizer = self.ai_processor.summarizer
+        self.tag_generator = self.ai_processor.tag_generator
         self.slack_bot = AINewsSlackBot(self.config, self.db)
+
+        # Shared pool for OpenAI calls; bounded so we respect rate limits
+        max_workers = self.config.get('performance', {}).get('max_concurrent_requests', 8)
+        self._llm_executor = ThreadPoolExecutor(max_workers=max_workers)
+
+        # Persistent pool for source collection: a fresh executor per
+        # cycle would strand each dead worker's thread-local DB
+        # connection in the manager's registry, leaking descriptors
+        # every scheduled run
+        self._collect_executor = ThreadPoolExecutor(
+            max_workers=8, thread_name_prefix='collector'
+        )
+
+        # Slack posting runs on its own daemon thread so collection ticks
+        # never block on the Slack Web API
+        self._slack_queue = queue.Queue(maxsize=32)
+        self._slack_thread = threading.Thread(target=self._slack_worker, daemon=True)
+        self._slack_thread.start()
         
-        # Initialize scheduler
+        # Initialize scheduler; interactive mode needs a non-blocking one
         timezone = self.config.get('schedule', {}).get('timezone', 'UTC')
-        self.scheduler = BlockingScheduler(timezone=pytz.timezone(timezone))
+        scheduler_cls = BackgroundScheduler if scheduler_type == "background" else BlockingScheduler
+        self.scheduler = scheduler_cls(timezone=pytz.timezone(timezone))
         
         logger.info("AI News Bot initialized successfully")
     
@@ -58,117 +91,210 @@ class AINewsBot:
         """Collect news from configured sources"""
         logger.info("Starting news collection...")
         
-        # Get sources to collect from
-        sources = self.db.get_sources(enabled_only=True)
-        
-        if language:
-            sources = [s for s in sources if s.language == language]
-        
+        # Get sources to collect from (indexed lookups, no Python scans)
         if source_name:
-            sources = [s for s in sources if s.name.lower() == source_name.lower()]
-        
+            source = self.db.get_source_by_name(source_name)
+            if source and (not language or source.language == language):
+                sources = [source]
+            else:
+                sources = []
+        elif language:
+            sources = self.db.get_sources_by_language(language)
+        else:
+            sources = self.db.get_sources(enabled_only=True)
+
         if not sources:
             logger.warning("No sources found for collection")
             return
         
         total_new_articles = 0
-        
-        for source in sources:
+
+        # Collection is network-bound and independent per source, so fan
+        # the fetch/enrich pipeline out over the persistent pool. DB
+        # writes stay on this thread (single writer), one transaction
+        # per source.
+        futures = {
+            self._collect_executor.submit(self._collect_one_source, source): source
+            for source in sources
+        }
+        for future in as_completed(futures):
+            source = futures[future]
             try:
-                logger.info(f"Collecting from source: {source.name}")
-                
-                # Create appropriate collector
-                if source.source_type == 'rss':
-                    collector = RSSCollector(source, self.config)
-                else:
-                    logger.warning(f"Unsupported source type: {source.source_type}")
-                    continue
-                
-                # Collect articles with logging
-                collection_log, articles = collector.collect_with_logging()
-                
-                # Save collection log
-                self.db.save_collection_log(collection_log)
-                
-                # Process new articles (check for duplicates first to avoid unnecessary processing)
-                new_articles = []
-                url_duplicate_count = 0
-                title_duplicate_count = 0
-                
-                for article in articles:
-                    # Check if article already exists by URL (early duplicate detection)
-                    existing_by_url = self.db.get_article_by_url(article.url)
-                    if existing_by_url:
-                        url_duplicate_count += 1
-                        logger.debug(f"Skipping duplicate URL: {article.title}")
-                        continue
-                    
-                    # Check if article already exists by title (additional duplicate detection)
-                    existing_by_title = self.db.get_article_by_title(article.title)
-                    if existing_by_title:
-                        title_duplicate_count += 1
-                        logger.debug(f"Skipping duplicate title: {article.title}")
-                        continue
-                    
-                    # Only process new articles
-                    try:
-                        # Generate summary
-                        try:
-                            article.summary = self.summarizer.summarize_article(article)
-                        except Exception as e:
-                            logger.warning(f"Failed to summarize article: {e}")
-                            article.summary = article.content[:200] + "..." if len(article.content) > 200 else article.content
-                        
-                        # Generate tags
-                        try:
-                            generated_tags = self.tag_generator.generate_tags(article)
-                            article.tags.extend(generated_tags)
-                            article.tags = list(set(article.tags))  # Remove duplicates
-                        except Exception as e:
-                            logger.warning(f"Failed to generate tags: {e}")
-                        
-                        # Save article
-                        self.db.save_article(article)
-                        new_articles.append(article)
-                        
-                        logger.info(f"Saved new article: {article.title}")
-                        
-                    except Exception as e:
-                        logger.error(f"Failed to process article '{article.title}': {e}")
-                        continue
-                
-                total_duplicate_count = url_duplicate_count + title_duplicate_count
-                if total_duplicate_count > 0:
-                    logger.info(f"Skipped {total_duplicate_count} duplicate articles from {source.name} (URLs: {url_duplicate_count}, Titles: {title_duplicate_count})")
-                
-                total_new_articles += len(new_articles)
-                
-                # Update source statistics
-                source.last_collected = datetime.now()
-                source.collection_count += 1
-                if collection_log.status == 'failed':
-                    source.error_count += 1
-                else:
-                    source.error_count = 0  # Reset on success
-                
-                self.db.save_source(source)
-                
-                logger.info(f"Collected {len(new_articles)} new articles from {source.name}")
-                
+                result = future.result()
             except Exception as e:
                 logger.error(f"Failed to collect from {source.name}: {e}")
                 continue
-        
+            if result is None:
+                continue
+
+            collection_log, enriched, duplicate_counts = result
+            new_articles = enriched
+
+            # One transaction per source: log, articles and source stats
+            # commit with a single fsync instead of one per row. A
+            # failed persist drops this source only, never the cycle
+            try:
+                with self.db.transaction():
+                    self.db.save_collection_log(collection_log)
+                    self.db.save_articles(enriched)
+                    self.db.save_source(source)
+            except Exception as e:
+                logger.error(f"Failed to save articles from {source.name}: {e}")
+                continue
+
+            for article in new_articles:
+                logger.info(f"Saved new article: {article.title}")
+
+            url_dup, title_dup, fuzzy_dup = duplicate_counts
+            total_duplicate_count = url_dup + title_dup + fuzzy_dup
+            if total_duplicate_count > 0:
+                logger.info(f"Skipped {total_duplicate_count} duplicate articles from {source.name} (URLs: {url_dup}, Titles: {title_dup}, Fuzzy: {fuzzy_dup})")
+
+            total_new_articles += len(new_articles)
+
+            logger.info(f"Collected {len(new_articles)} new articles from {source.name}")
+
         logger.info(f"Collection completed. Total new articles: {total_new_articles}")
         
         # Post to Slack if there are new articles
         if total_new_articles > 0:
             recent_articles = self.db.get_articles(limit=5)
-            self.slack_bot.post_articles_summary(
-                recent_articles, 
+            self._queue_slack_post(
+                recent_articles,
                 f"🤖 AI News Update - {total_new_articles} New Articles"
             )
+
+    def _collect_one_source(self, source):
+        """Fetch, dedupe and enrich one source; returns results for the
+        main thread to persist, or None for unsupported source types."""
+        logger.info(f"Collecting from source: {source.name}")
+
+        if source.source_type == 'rss':
+            collector = RSSCollector(source, self.config)
+        else:
+            logger.warning(f"Unsupported source type: {source.source_type}")
+            return None
+
+        # Collect articles with logging
+        collection_log, articles = collector.collect_with_logging()
+
+        # Filter out duplicates up front with two batched queries
+        # instead of two SELECTs per article. Titles are matched on
+        # normalized hashes so whitespace/width variants don't slip by.
+        title_hashes = {a.url: compute_title_hash(a.title) for a in articles}
+        existing_urls = self.db.get_existing_urls([a.url for a in articles])
+        existing_hashes = self.db.get_existing_title_hashes(list(title_hashes.values()))
+
+        candidates = [a for a in articles if a.url not in existing_urls]
+        url_duplicate_count = len(articles) - len(candidates)
+
+        # Screen against the DB and within the batch itself — a feed can
+        # carry the same headline twice under different URLs
+        articles = []
+        seen_hashes = set()
+        for a in candidates:
+            title_hash = title_hashes[a.url]
+            if title_hash in existing_hashes or title_hash in seen_hashes:
+                continue
+            seen_hashes.add(title_hash)
+            articles.append(a)
+        title_duplicate_count = len(candidates) - len(articles)
+
+        # Fuzzy pass only on survivors of the O(1) hash passes —
+        # its cost scales with the residual set, not the feed size
+        fuzzy_duplicate_count = 0
+        dedup_config = self.config.get('filtering', {}).get('duplicate_detection', {})
+        if dedup_config.get('enabled', True) and articles:
+            survivors = []
+            for article in articles:
+                if self.db.find_similar_title(article.title):
+                    fuzzy_duplicate_count += 1
+                else:
+                    survivors.append(article)
+            articles = survivors
+
+        # Update source statistics
+        source.last_collected = datetime.now()
+        source.collection_count += 1
+        if collection_log.status == 'failed':
+            source.error_count += 1
+        else:
+            source.error_count = 0  # Reset on success
+
+        # Summarize and tag all new articles concurrently; the
+        # OpenAI round trips dominate wall time, so latency is
+        # bounded by the slowest call rather than the sum
+        enriched = []
+        if articles:
+            futures = {
+                self._llm_executor.submit(self._enrich_article, a): a
+                for a in articles
+            }
+            for future in as_completed(futures):
+                article = futures[future]
+                try:
+                    enriched.append(future.result())
+                except Exception as e:
+                    logger.error(f"Failed to process article '{article.title}': {e}")
+
+        duplicate_counts = (url_duplicate_count, title_duplicate_count, fuzzy_duplicate_count)
+        return collection_log, enriched, duplicate_counts
+
+    def _slack_worker(self):
+        """Post queued article summaries to Slack in the background"""
+        while True:
+            articles, title = self._slack_queue.get()
+            try:
+                self.slack_bot.post_articles_paged(articles, title)
+            except Exception as e:
+                logger.error(f"Failed to post articles to Slack: {e}")
+            finally:
+                self._slack_queue.task_done()
+
+    def _queue_slack_post(self, articles, title):
+        """Queue a Slack post, dropping the oldest entry if the queue is full"""
+        try:
+            self._slack_queue.put_nowait((articles, title))
+        except queue.Full:
+            try:
+                self._slack_queue.get_nowait()
+                self._slack_queue.task_done()
+            except queue.Empty:
+                pass
+            self._slack_queue.put_nowait((articles, title))
     
+    def _enrich_article(self, article):
+        """Generate summary and tags for a single article"""
+        min_chars = self.config.get('summarizer', {}).get('min_chars', 200)
+        has_text = any(c.isalnum() for c in article.title + article.content)
+        generated_tags = []
+
+        # Content already shorter than the summary target (common for
+        # headline-only RSS entries) needs no LLM summarization; only
+        # tagging remains
+        if len(article.content) <= min_chars:
+            article.summary = article.content
+            if has_text:
+                try:
+                    generated_tags = self.tag_generator.generate_tags(article)
+                except Exception as e:
+                    logger.warning(f"Failed to generate tags: {e}")
+        else:
+            # One combined call returns summary and tags together
+            try:
+                result = self.ai_processor.analyze(article)
+                article.summary = result['summary']
+                generated_tags = result['tags']
+            except Exception as e:
+                logger.warning(f"Failed to analyze article: {e}")
+                article.summary = article.content[:200] + "..." if len(article.content) > 200 else article.content
+
+        if generated_tags:
+            article.tags.extend(generated_tags)
+            article.tags = list(dict.fromkeys(article.tags))  # Dedupe, keep order
+
+        return article
+
     def setup_scheduler(self):
         """Setup scheduled jobs"""
         schedule_config = self.config.get('schedule', {})
@@ -318,39 +444,29 @@ class AINewsBot:
         else:
             logger.warning("No jobs scheduled")
         
-        # Start scheduler in background (non-blocking)
-        from apscheduler.schedulers.background import BackgroundScheduler
-        import pytz
-        
-        # Replace blocking scheduler with background scheduler
-        timezone = self.config.get('schedule', {}).get('timezone', 'UTC')
-        bg_scheduler = BackgroundScheduler(timezone=pytz.timezone(timezone))
-        
-        # Copy jobs from blocking scheduler to background scheduler
-        for job in self.scheduler.get_jobs():
-            bg_scheduler.add_job(
-                func=job.func,
-                trigger=job.trigger,
-                id=job.id,
-                name=job.name
-            )
-        
-        bg_scheduler.start()
+        # Start the (background) scheduler without blocking this thread
+        self.scheduler.start()
         logger.info("Background scheduler started")
         
         # Start Slack socket mode if configured
         if self.slack_bot.socket_client:
             self.slack_bot.start_socket_mode()
         
-        # Keep running
+        # Block until shutdown is requested instead of polling every second
+        self._stop_event = threading.Event()
+        signal.signal(signal.SIGTERM, lambda *_: self._stop_event.set())
+
         try:
-            while True:
-                import time
-                time.sleep(1)
+            self._stop_event.wait()
         except KeyboardInterrupt:
-            logger.info("Interactive mode stopped by user")
-            bg_scheduler.shutdown()
-            stop_health_check()
+            pass
+
+        logger.info("Interactive mode stopped")
+        self.scheduler.shutdown()
+        stop_health_check()
+        self._collect_executor.shutdown(wait=False)
+        self._llm_executor.shutdown(wait=False)
+        self.db.close()
 
 
 def main():
@@ -379,7 +495,10 @@ def main():
     
     try:
         # Initialize bot
-        bot = AINewsBot(args.config)
+        bot = AINewsBot(
+            args.config,
+            scheduler_type="background" if args.interactive else "blocking"
+        )
         
         # Test connections
         if args.test:
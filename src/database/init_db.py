@@ -31,82 +31,85 @@ def init_database():
     
     # Add default sources from config
     sources_config = config.get('sources', {})
-    
-    # Add English RSS sources
-    english_rss = sources_config.get('english', {}).get('rss_feeds', [])
-    for source_config in english_rss:
-        if source_config.get('enabled', True):
-            source = Source(
-                name=source_config['name'],
-                url=source_config['url'],
-                source_type='rss',
-                language='english',
-                enabled=True,
-                tags=source_config.get('tags', [])
-            )
-            db.save_source(source)
-            print(f"Added English RSS source: {source.name}")
-    
-    # Add English website sources
-    english_websites = sources_config.get('english', {}).get('websites', [])
-    for source_config in english_websites:
-        if source_config.get('enabled', True):
-            source = Source(
-                name=source_config['name'],
-                url=source_config['url'],
-                source_type='website',
-                language='english',
-                enabled=True,
-                tags=source_config.get('tags', []),
-                config={'selector': source_config.get('selector', '')}
-            )
-            db.save_source(source)
-            print(f"Added English website source: {source.name}")
-    
-    # Add Japanese RSS sources
-    japanese_rss = sources_config.get('japanese', {}).get('rss_feeds', [])
-    for source_config in japanese_rss:
-        if source_config.get('enabled', True):
-            source = Source(
-                name=source_config['name'],
-                url=source_config['url'],
-                source_type='rss',
-                language='japanese',
-                enabled=True,
-                tags=source_config.get('tags', []),
-                config={'filter_keywords': source_config.get('filter_keywords', [])}
-            )
-            db.save_source(source)
-            print(f"Added Japanese RSS source: {source.name}")
-    
-    # Add Japanese website sources
-    japanese_websites = sources_config.get('japanese', {}).get('websites', [])
-    for source_config in japanese_websites:
-        if source_config.get('enabled', True):
-            source = Source(
-                name=source_config['name'],
-                url=source_config['url'],
-                source_type='website',
-                language='japanese',
-                enabled=True,
-                tags=source_config.get('tags', []),
-                config={'selector': source_config.get('selector', '')}
+
+    # One transaction for all default rows: N inserts pay a single
+    # fsync instead of one commit each
+    with db.transaction():
+        # Add English RSS sources
+        english_rss = sources_config.get('english', {}).get('rss_feeds', [])
+        for source_config in english_rss:
+            if source_config.get('enabled', True):
+                source = Source(
+                    name=source_config['name'],
+                    url=source_config['url'],
+                    source_type='rss',
+                    language='english',
+                    enabled=True,
+                    tags=source_config.get('tags', [])
+                )
+                db.save_source(source)
+                print(f"Added English RSS source: {source.name}")
+
+        # Add English website sources
+        english_websites = sources_config.get('english', {}).get('websites', [])
+        for source_config in english_websites:
+            if source_config.get('enabled', True):
+                source = Source(
+                    name=source_config['name'],
+                    url=source_config['url'],
+                    source_type='website',
+                    language='english',
+                    enabled=True,
+                    tags=source_config.get('tags', []),
+                    config={'selector': source_config.get('selector', '')}
+                )
+                db.save_source(source)
+                print(f"Added English website source: {source.name}")
+
+        # Add Japanese RSS sources
+        japanese_rss = sources_config.get('japanese', {}).get('rss_feeds', [])
+        for source_config in japanese_rss:
+            if source_config.get('enabled', True):
+                source = Source(
+                    name=source_config['name'],
+                    url=source_config['url'],
+                    source_type='rss',
+                    language='japanese',
+                    enabled=True,
+                    tags=source_config.get('tags', []),
+                    config={'filter_keywords': source_config.get('filter_keywords', [])}
+                )
+                db.save_source(source)
+                print(f"Added Japanese RSS source: {source.name}")
+
+        # Add Japanese website sources
+        japanese_websites = sources_config.get('japanese', {}).get('websites', [])
+        for source_config in japanese_websites:
+            if source_config.get('enabled', True):
+                source = Source(
+                    name=source_config['name'],
+                    url=source_config['url'],
+                    source_type='website',
+                    language='japanese',
+                    enabled=True,
+                    tags=source_config.get('tags', []),
+                    config={'selector': source_config.get('selector', '')}
+                )
+                db.save_source(source)
+                print(f"Added Japanese website source: {source.name}")
+
+        # Add default tags from config
+        tagging_config = config.get('tagging', {}).get('categories', {})
+        for category_name, category_config in tagging_config.items():
+            tag = Tag(
+                name=category_name,
+                category='auto',
+                description=f"Auto-generated tag for {category_name}",
+                color=get_category_color(category_name)
             )
-            db.save_source(source)
-            print(f"Added Japanese website source: {source.name}")
-    
-    # Add default tags from config
-    tagging_config = config.get('tagging', {}).get('categories', {})
-    for category_name, category_config in tagging_config.items():
-        tag = Tag(
-            name=category_name,
-            category='auto',
-            description=f"Auto-generated tag for {category_name}",
-            color=get_category_color(category_name)
-        )
-        db.save_tag(tag)
-        print(f"Added tag: {tag.name}")
-    
+            db.save_tag(tag)
+            print(f"Added tag: {tag.name}")
+
     print("Database initialization completed successfully!")
     
     # Print statistics
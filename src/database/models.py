@@ -2,14 +2,144 @@
 Database models for the AI News Slack Bot
 """
 
+import hashlib
 import sqlite3
+import threading
+import unicodedata
+from collections import namedtuple
+from contextlib import contextmanager
 from datetime import datetime
 from typing import List, Optional, Dict, Any
 from dataclasses import dataclass
 import json
 
+try:
+    from rapidfuzz.distance import Levenshtein as _Levenshtein
+except ImportError:
+    _Levenshtein = None
 
-@dataclass
+
+# orjson is a drop-in C codec for the tags/metadata/errors columns;
+# stored values stay valid JSON either way
+try:
+    import orjson
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+    _json_loads = json.loads
+
+
+def _convert_timestamp(value: bytes) -> Optional[datetime]:
+    """sqlite3 converter for TIMESTAMP columns (tolerates bad rows)"""
+    try:
+        return datetime.fromisoformat(value.decode())
+    except ValueError:
+        return None
+
+
+# TIMESTAMP columns round-trip as datetime objects so row mapping
+# doesn't re-parse ISO strings per row
+sqlite3.register_adapter(datetime, lambda dt: dt.isoformat(sep=' '))
+sqlite3.register_converter('TIMESTAMP', _convert_timestamp)
+
+
+# Explicit column lists keep SELECT ordering locked to the positional
+# _row_to_* unpackers regardless of a database's migration history
+_ARTICLE_COLUMN_LIST = (
+    'id', 'title', 'url', 'content', 'summary', 'language', 'source',
+    'author', 'published_date', 'collected_date', 'tags', 'metadata',
+    'title_hash'
+)
+_ARTICLE_COLUMNS = ", ".join(_ARTICLE_COLUMN_LIST)
+_ARTICLE_COLUMNS_PREFIXED = ", ".join("a." + c for c in _ARTICLE_COLUMN_LIST)
+_SOURCE_COLUMNS = (
+    "id, name, url, source_type, language, enabled, last_collected, "
+    "collection_count, error_count, tags, config"
+)
+_TAG_COLUMNS = "id, name, category, description, color, usage_count, created_date"
+
+# UPSERT keeps the existing rowid on re-polled articles (so
+# article_tags references stay valid) and skips the write entirely
+# when nothing changed, instead of OR REPLACE's delete+reinsert
+_UPSERT_ARTICLE_SQL = """
+    INSERT INTO articles
+    (title, url, content, summary, language, source, author,
+     published_date, collected_date, tags, metadata, title_hash)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(url) DO UPDATE SET
+        title = excluded.title,
+        content = excluded.content,
+        summary = excluded.summary,
+        language = excluded.language,
+        author = excluded.author,
+        published_date = excluded.published_date,
+        tags = excluded.tags,
+        metadata = excluded.metadata,
+        title_hash = excluded.title_hash
+    WHERE articles.content IS NOT excluded.content
+       OR articles.summary IS NOT excluded.summary
+       OR articles.title IS NOT excluded.title
+"""
+
+
+def _bounded_levenshtein(a: str, b: str, max_distance: int) -> int:
+    """Two-row Levenshtein distance with early exit above max_distance.
+
+    Pure-Python fallback for when rapidfuzz is not installed; returns
+    max_distance + 1 as soon as the bound cannot be met.
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    if a == b:
+        return 0
+
+    prev = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        curr = [i] + [0] * len(b)
+        row_best = i
+        for j, cb in enumerate(b, 1):
+            curr[j] = min(
+                prev[j] + 1,
+                curr[j - 1] + 1,
+                prev[j - 1] + (ca != cb)
+            )
+            if curr[j] < row_best:
+                row_best = curr[j]
+        if row_best > max_distance:
+            return max_distance + 1
+        prev = curr
+
+    return prev[-1] if prev[-1] <= max_distance else max_distance + 1
+
+
+def title_distance(a: str, b: str, max_distance: int) -> int:
+    """Edit distance between two titles, capped at max_distance + 1"""
+    if _Levenshtein is not None:
+        return _Levenshtein.distance(a, b, score_cutoff=max_distance)
+    return _bounded_levenshtein(a, b, max_distance)
+
+
+def normalize_title(title: str) -> str:
+    """Normalize a title for duplicate detection (NFKC, lowercase, collapsed whitespace)"""
+    if not title:
+        return ""
+    return " ".join(unicodedata.normalize('NFKC', title).lower().split())
+
+
+def compute_title_hash(title: str) -> bytes:
+    """16-byte BLAKE2b digest of the normalized title"""
+    return hashlib.blake2b(
+        normalize_title(title).encode('utf-8'), digest_size=16
+    ).digest()
+
+
+@dataclass(slots=True)
 class Article:
     """Article data model"""
     id: Optional[int] = None
@@ -24,7 +154,7 @@ class Article:
     collected_date: Optional[datetime] = None
     tags: List[str] = None
     metadata: Dict[str, Any] = None
-    
+
     def __post_init__(self):
         if self.tags is None:
             self.tags = []
@@ -34,7 +164,7 @@ class Article:
             self.collected_date = datetime.now()
 
 
-@dataclass
+@dataclass(slots=True)
 class Source:
     """News source data model"""
     id: Optional[int] = None
@@ -48,7 +178,7 @@ class Source:
     error_count: int = 0
     tags: List[str] = None
     config: Dict[str, Any] = None
-    
+
     def __post_init__(self):
         if self.tags is None:
             self.tags = []
@@ -66,7 +196,7 @@ class Tag:
     color: str = "#000000"
     usage_count: int = 0
     created_date: Optional[datetime] = None
-    
+
     def __post_init__(self):
         if self.created_date is None:
             self.created_date = datetime.now()
@@ -84,7 +214,7 @@ class CollectionLog:
     errors: List[str] = None
     duration_seconds: float = 0.0
     status: str = "success"  # success, partial, failed
-    
+
     def __post_init__(self):
         if self.collection_date is None:
             self.collection_date = datetime.now()
@@ -92,119 +222,324 @@ class CollectionLog:
             self.errors = []
 
 
+# Lightweight projection of an article for listing paths; cheaper to
+# build than the full Article dataclass and skips the content column
+ArticleSummary = namedtuple(
+    'ArticleSummary',
+    ['id', 'title', 'source', 'language', 'published_date', 'url',
+     'summary', 'tags']
+)
+
+
 class DatabaseManager:
     """Database manager for SQLite operations"""
-    
+
     def __init__(self, db_path: str):
         self.db_path = db_path
+        self._local = threading.local()
+        self._all_conns: List[sqlite3.Connection] = []
+        self._conns_lock = threading.Lock()
+        self._sources_cache: Optional[List[Source]] = None
+        self._sources_by_lang: Optional[Dict[str, List[Source]]] = None
         self.init_database()
-    
+
     def get_connection(self) -> sqlite3.Connection:
-        """Get database connection"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        """Get this thread's persistent connection, creating it on first use.
+
+        One connection per thread keeps pragma state and the WAL index
+        hot across calls while collector threads read concurrently with
+        the main writer.
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.db_path,
+                check_same_thread=False,
+                isolation_level=None,
+                detect_types=sqlite3.PARSE_DECLTYPES
+            )
+            conn.row_factory = sqlite3.Row
+            # Tuned for a long-running process: WAL lets readers and the
+            # writer proceed concurrently, NORMAL halves fsyncs per commit
+            if self.db_path != ':memory:':
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA mmap_size=268435456")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA cache_size=-64000")
+            conn.execute("PRAGMA busy_timeout=5000")
+            self._local.conn = conn
+            with self._conns_lock:
+                self._all_conns.append(conn)
         return conn
-    
+
+    def close(self):
+        """Close every thread's connection"""
+        with self._conns_lock:
+            for conn in self._all_conns:
+                try:
+                    conn.close()
+                except sqlite3.Error:
+                    pass
+            self._all_conns.clear()
+        self._local = threading.local()
+
+    @contextmanager
+    def transaction(self):
+        """Group multiple writes into a single transaction (one fsync)"""
+        conn = self.get_connection()
+        if conn.in_transaction:
+            # Already inside an explicit transaction on this thread;
+            # let the outermost block own commit/rollback
+            yield conn
+            return
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    @contextmanager
+    def read_snapshot(self):
+        """Run several reads against one consistent snapshot.
+
+        A deferred transaction pins this thread's WAL read mark, so a
+        multi-query report sees a single point in time and skips the
+        per-statement lock handshake — without taking the write lock
+        transaction() does.
+        """
+        conn = self.get_connection()
+        if conn.in_transaction:
+            yield conn
+            return
+        conn.execute("BEGIN")
+        try:
+            yield conn
+        finally:
+            conn.execute("COMMIT")
+
     def init_database(self):
         """Initialize database tables"""
-        with self.get_connection() as conn:
-            # Articles table
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS articles (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    title TEXT NOT NULL,
-                    url TEXT UNIQUE NOT NULL,
-                    content TEXT,
-                    summary TEXT,
-                    language TEXT,
-                    source TEXT,
-                    author TEXT,
-                    published_date TIMESTAMP,
-                    collected_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    tags TEXT,  -- JSON array
-                    metadata TEXT  -- JSON object
-                )
-            """)
-            
-            # Sources table
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS sources (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT UNIQUE NOT NULL,
-                    url TEXT NOT NULL,
-                    source_type TEXT NOT NULL,
-                    language TEXT,
-                    enabled BOOLEAN DEFAULT 1,
-                    last_collected TIMESTAMP,
-                    collection_count INTEGER DEFAULT 0,
-                    error_count INTEGER DEFAULT 0,
-                    tags TEXT,  -- JSON array
-                    config TEXT  -- JSON object
-                )
-            """)
-            
-            # Tags table
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS tags (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT UNIQUE NOT NULL,
-                    category TEXT,
-                    description TEXT,
-                    color TEXT DEFAULT '#000000',
-                    usage_count INTEGER DEFAULT 0,
-                    created_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            
-            # Collection logs table
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS collection_logs (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    source_id INTEGER,
-                    collection_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    articles_found INTEGER DEFAULT 0,
-                    articles_processed INTEGER DEFAULT 0,
-                    articles_new INTEGER DEFAULT 0,
-                    errors TEXT,  -- JSON array
-                    duration_seconds REAL DEFAULT 0.0,
-                    status TEXT DEFAULT 'success',
-                    FOREIGN KEY (source_id) REFERENCES sources (id)
-                )
-            """)
-            
-            # Article-Tag relationship table
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS article_tags (
-                    article_id INTEGER,
-                    tag_id INTEGER,
-                    confidence REAL DEFAULT 1.0,
-                    PRIMARY KEY (article_id, tag_id),
-                    FOREIGN KEY (article_id) REFERENCES articles (id) ON DELETE CASCADE,
-                    FOREIGN KEY (tag_id) REFERENCES tags (id) ON DELETE CASCADE
-                )
-            """)
-            
-            # Create indexes for better performance
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_url ON articles(url)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_title ON articles(title)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_published_date ON articles(published_date)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_collected_date ON articles(collected_date)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_language ON articles(language)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_source ON articles(source)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_sources_enabled ON sources(enabled)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_collection_logs_date ON collection_logs(collection_date)")
-            
-            conn.commit()
-    
+        conn = self.get_connection()
+        # Articles table
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS articles (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                title TEXT NOT NULL,
+                url TEXT UNIQUE NOT NULL,
+                content TEXT,
+                summary TEXT,
+                language TEXT,
+                source TEXT,
+                author TEXT,
+                published_date TIMESTAMP,
+                collected_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                tags TEXT,  -- JSON array
+                metadata TEXT,  -- JSON object
+                title_hash BLOB  -- BLAKE2b-128 of the normalized title
+            )
+        """)
+
+        # Sources table
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS sources (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT UNIQUE NOT NULL,
+                url TEXT NOT NULL,
+                source_type TEXT NOT NULL,
+                language TEXT,
+                enabled BOOLEAN DEFAULT 1,
+                last_collected TIMESTAMP,
+                collection_count INTEGER DEFAULT 0,
+                error_count INTEGER DEFAULT 0,
+                tags TEXT,  -- JSON array
+                config TEXT  -- JSON object
+            )
+        """)
+
+        # Tags table
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS tags (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT UNIQUE NOT NULL,
+                category TEXT,
+                description TEXT,
+                color TEXT DEFAULT '#000000',
+                usage_count INTEGER DEFAULT 0,
+                created_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+
+        # Collection logs table
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS collection_logs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                source_id INTEGER,
+                collection_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                articles_found INTEGER DEFAULT 0,
+                articles_processed INTEGER DEFAULT 0,
+                articles_new INTEGER DEFAULT 0,
+                errors TEXT,  -- JSON array
+                duration_seconds REAL DEFAULT 0.0,
+                status TEXT DEFAULT 'success',
+                FOREIGN KEY (source_id) REFERENCES sources (id)
+            )
+        """)
+
+        # Article-Tag relationship table
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS article_tags (
+                article_id INTEGER,
+                tag_id INTEGER,
+                confidence REAL DEFAULT 1.0,
+                PRIMARY KEY (article_id, tag_id),
+                FOREIGN KEY (article_id) REFERENCES articles (id) ON DELETE CASCADE,
+                FOREIGN KEY (tag_id) REFERENCES tags (id) ON DELETE CASCADE
+            )
+        """)
+
+        # LLM summary cache keyed by a content fingerprint, so
+        # re-polled feed bodies never trigger a second OpenAI call
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS summary_cache (
+                content_hash TEXT PRIMARY KEY,
+                summary TEXT NOT NULL,
+                model TEXT,
+                created_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+
+        # Create indexes for better performance
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_url ON articles(url)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_title ON articles(title)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_published_date ON articles(published_date)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_collected_date ON articles(collected_date)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_language ON articles(language)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_source ON articles(source)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_source_url ON articles(source, url)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_source_title ON articles(source, title)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_sources_enabled ON sources(enabled)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_tags_usage ON tags(usage_count DESC)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_collection_logs_date ON collection_logs(collection_date)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_article_tags_tag ON article_tags(tag_id, article_id)")
+        # Covering indexes for get_collection_stats: grouping columns
+        # lead so the GROUP BY follows index order (no temp b-tree) and
+        # the date predicate is checked in the index, never the heap
+        conn.execute("DROP INDEX IF EXISTS idx_articles_collected_lang_source")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_lang_source_collected ON articles(language, source, collected_date)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_logs_date_status ON collection_logs(collection_date, status)")
+        # Expression index so find_similar_title's length pre-filter is
+        # a range probe instead of a full table scan
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_title_len ON articles(length(title))")
+
+        # Databases created before the title_hash column need migration
+        try:
+            conn.execute("ALTER TABLE articles ADD COLUMN title_hash BLOB")
+        except sqlite3.OperationalError:
+            pass  # column already exists
+
+        missing = conn.execute(
+            "SELECT id, title FROM articles WHERE title_hash IS NULL"
+        ).fetchall()
+        if missing:
+            conn.executemany(
+                "UPDATE articles SET title_hash = ? WHERE id = ?",
+                [(compute_title_hash(row['title']), row['id']) for row in missing]
+            )
+
+        # The index must be non-unique: the article UPSERT conflicts on
+        # url only, and two distinct URLs can legitimately share a
+        # headline (syndicated press releases). The batched hash probe
+        # only needs the O(log N) lookup. Databases that got the earlier
+        # UNIQUE variant are migrated in place.
+        row = conn.execute(
+            "SELECT sql FROM sqlite_master "
+            "WHERE type = 'index' AND name = 'idx_articles_title_hash'"
+        ).fetchone()
+        if row and row['sql'] and 'UNIQUE' in row['sql'].upper():
+            conn.execute("DROP INDEX idx_articles_title_hash")
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_articles_title_hash "
+            "ON articles(title_hash)"
+        )
+
+        # Articles saved before the join table existed carry JSON tags
+        # but no link rows, so tag-filtered queries would never see
+        # them. Backfill once, like the title_hash migration above.
+        missing_links = conn.execute("""
+            SELECT id, tags FROM articles a
+            WHERE tags IS NOT NULL AND tags != '' AND tags != '[]'
+              AND NOT EXISTS (
+                  SELECT 1 FROM article_tags at WHERE at.article_id = a.id
+              )
+        """).fetchall()
+        for article_id, tags_json in missing_links:
+            tags = _json_loads(tags_json)
+            if isinstance(tags, list) and tags:
+                self._link_article_tags(conn, article_id, tags)
+
+        self._init_fts(conn)
+
+        conn.commit()
+
+    def _init_fts(self, conn: sqlite3.Connection):
+        """Create the FTS5 shadow table and sync triggers for search.
+
+        The trigram tokenizer handles Japanese (no word boundaries);
+        older SQLite builds fall back to unicode61. Existing rows are
+        backfilled once when the table is first created.
+        """
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name='articles_fts'"
+        ).fetchone()
+
+        if not exists:
+            try:
+                conn.execute("""
+                    CREATE VIRTUAL TABLE articles_fts USING fts5(
+                        title, content, summary,
+                        content='articles', content_rowid='id',
+                        tokenize='trigram'
+                    )
+                """)
+            except sqlite3.OperationalError:
+                try:
+                    conn.execute("""
+                        CREATE VIRTUAL TABLE articles_fts USING fts5(
+                            title, content, summary,
+                            content='articles', content_rowid='id',
+                            tokenize='unicode61 remove_diacritics 2'
+                        )
+                    """)
+                except sqlite3.OperationalError:
+                    return  # no FTS5 in this build; search falls back to LIKE
+            conn.execute("INSERT INTO articles_fts(articles_fts) VALUES('rebuild')")
+
+        conn.executescript("""
+            CREATE TRIGGER IF NOT EXISTS articles_fts_ai AFTER INSERT ON articles BEGIN
+                INSERT INTO articles_fts(rowid, title, content, summary)
+                VALUES (new.id, new.title, new.content, new.summary);
+            END;
+            CREATE TRIGGER IF NOT EXISTS articles_fts_ad AFTER DELETE ON articles BEGIN
+                INSERT INTO articles_fts(articles_fts, rowid, title, content, summary)
+                VALUES ('delete', old.id, old.title, old.content, old.summary);
+            END;
+            CREATE TRIGGER IF NOT EXISTS articles_fts_au AFTER UPDATE ON articles BEGIN
+                INSERT INTO articles_fts(articles_fts, rowid, title, content, summary)
+                VALUES ('delete', old.id, old.title, old.content, old.summary);
+                INSERT INTO articles_fts(rowid, title, content, summary)
+                VALUES (new.id, new.title, new.content, new.summary);
+            END;
+        """)
+
     def save_article(self, article: Article) -> int:
         """Save article to database"""
-        with self.get_connection() as conn:
-            cursor = conn.execute("""
-                INSERT OR REPLACE INTO articles 
-                (title, url, content, summary, language, source, author, 
-                 published_date, collected_date, tags, metadata)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
+        # One transaction (one fsync) covers the article row and its
+        # article_tags links, so readers never see them out of step
+        with self.transaction() as conn:
+            conn.execute(_UPSERT_ARTICLE_SQL, (
                 article.title,
                 article.url,
                 article.content,
@@ -214,236 +549,543 @@ class DatabaseManager:
                 article.author,
                 article.published_date,
                 article.collected_date,
-                json.dumps(article.tags),
-                json.dumps(article.metadata)
+                _json_dumps(article.tags),
+                _json_dumps(article.metadata),
+                compute_title_hash(article.title)
             ))
-            return cursor.lastrowid
-    
+            # lastrowid is unreliable on the DO UPDATE arm; one indexed
+            # probe on the UNIQUE url column gets the real id either way
+            row = conn.execute(
+                "SELECT id FROM articles WHERE url = ?", (article.url,)
+            ).fetchone()
+            article_id = row[0] if row else None
+            self._link_article_tags(conn, article_id, article.tags)
+        return article_id
+
+    def _link_article_tags(self, conn: sqlite3.Connection,
+                           article_id: Optional[int], tags: List[str]):
+        """Mirror an article's tag list into the article_tags join table"""
+        if not article_id or not tags:
+            return
+        conn.executemany(
+            "INSERT OR IGNORE INTO tags (name, category) VALUES (?, 'auto')",
+            [(tag,) for tag in tags]
+        )
+        conn.executemany("""
+            INSERT OR IGNORE INTO article_tags (article_id, tag_id)
+            SELECT ?, id FROM tags WHERE name = ?
+        """, [(article_id, tag) for tag in tags])
+
+    def save_articles(self, articles: List[Article]) -> int:
+        """Save many articles with one executemany in one transaction"""
+        if not articles:
+            return 0
+        rows = (
+            (
+                a.title, a.url, a.content, a.summary, a.language, a.source,
+                a.author, a.published_date, a.collected_date,
+                _json_dumps(a.tags), _json_dumps(a.metadata),
+                compute_title_hash(a.title)
+            )
+            for a in articles
+        )
+        tagged = [a for a in articles if a.tags]
+        with self.transaction() as conn:
+            conn.executemany(_UPSERT_ARTICLE_SQL, rows)
+            if tagged:
+                # One chunked probe maps url -> id for every tagged
+                # article instead of a point lookup per article
+                ids_by_url = {}
+                urls = [a.url for a in tagged]
+                for i in range(0, len(urls), 500):
+                    chunk = urls[i:i + 500]
+                    placeholders = ",".join("?" * len(chunk))
+                    ids_by_url.update(conn.execute(
+                        f"SELECT url, id FROM articles WHERE url IN ({placeholders})",
+                        chunk
+                    ))
+                for article in tagged:
+                    self._link_article_tags(
+                        conn, ids_by_url.get(article.url), article.tags
+                    )
+        return len(articles)
+
+    def get_article(self, article_id: int) -> Optional[Article]:
+        """Get article by primary key"""
+        conn = self.get_connection()
+        row = conn.execute(f"SELECT {_ARTICLE_COLUMNS} FROM articles WHERE id = ?", (article_id,)).fetchone()
+        if row:
+            return self._row_to_article(row)
+        return None
+
     def get_article_by_url(self, url: str) -> Optional[Article]:
         """Get article by URL"""
-        with self.get_connection() as conn:
-            row = conn.execute("SELECT * FROM articles WHERE url = ?", (url,)).fetchone()
-            if row:
-                return self._row_to_article(row)
-            return None
-    
+        conn = self.get_connection()
+        row = conn.execute(f"SELECT {_ARTICLE_COLUMNS} FROM articles WHERE url = ?", (url,)).fetchone()
+        if row:
+            return self._row_to_article(row)
+        return None
+
     def get_article_by_title(self, title: str, source: str = None) -> Optional[Article]:
         """Get article by title (optionally filtered by source)"""
-        with self.get_connection() as conn:
-            if source:
-                row = conn.execute("SELECT * FROM articles WHERE title = ? AND source = ?", (title, source)).fetchone()
-            else:
-                row = conn.execute("SELECT * FROM articles WHERE title = ?", (title,)).fetchone()
-            if row:
-                return self._row_to_article(row)
+        conn = self.get_connection()
+        if source:
+            row = conn.execute(f"SELECT {_ARTICLE_COLUMNS} FROM articles WHERE title = ? AND source = ?", (title, source)).fetchone()
+        else:
+            row = conn.execute(f"SELECT {_ARTICLE_COLUMNS} FROM articles WHERE title = ?", (title,)).fetchone()
+        if row:
+            return self._row_to_article(row)
+        return None
+
+    def get_existing_urls(self, urls: List[str]) -> set:
+        """Get the subset of given URLs that already exist in the database"""
+        existing = set()
+        conn = self.get_connection()
+        # Chunk to stay under SQLite's bound-parameter limit
+        for i in range(0, len(urls), 500):
+            chunk = urls[i:i + 500]
+            placeholders = ",".join("?" * len(chunk))
+            rows = conn.execute(
+                f"SELECT url FROM articles WHERE url IN ({placeholders})",
+                chunk
+            ).fetchall()
+            existing.update(row[0] for row in rows)
+        return existing
+
+    def get_existing_title_hashes(self, hashes: List[bytes]) -> set:
+        """Get the subset of given title hashes that already exist in the database"""
+        existing = set()
+        conn = self.get_connection()
+        for i in range(0, len(hashes), 500):
+            chunk = hashes[i:i + 500]
+            placeholders = ",".join("?" * len(chunk))
+            rows = conn.execute(
+                f"SELECT title_hash FROM articles WHERE title_hash IN ({placeholders})",
+                chunk
+            ).fetchall()
+            existing.update(row[0] for row in rows)
+        return existing
+
+    def find_similar_title(self, title: str) -> Optional[str]:
+        """Find a stored title within a small edit distance of the given one.
+
+        Candidates are pre-filtered to titles within ±20% of the length so
+        the bounded Levenshtein only runs on plausible matches; the cutoff
+        of min(len)/8 accepts only near-identical variants.
+        """
+        normalized = normalize_title(title)
+        if not normalized:
             return None
-    
-    def get_articles(self, limit: int = 50, offset: int = 0, 
+
+        lo = int(len(normalized) * 0.8)
+        hi = int(len(normalized) * 1.2) + 1
+
+        conn = self.get_connection()
+        for row in conn.execute(
+            "SELECT title FROM articles WHERE length(title) BETWEEN ? AND ?",
+            (lo, hi)
+        ):
+            candidate = normalize_title(row[0])
+            cutoff = max(1, min(len(normalized), len(candidate)) // 8)
+            if title_distance(normalized, candidate, cutoff) <= cutoff:
+                return row[0]
+        return None
+
+    def is_duplicate_tiered(self, article: "Article") -> tuple:
+        """Check whether an article duplicates a stored one, cheapest pass first.
+
+        Pass 1: indexed URL lookup. Pass 2: indexed normalized-title-hash
+        lookup. Pass 3: bounded fuzzy match, reached only by the small
+        residual set the O(1) passes couldn't decide. Returns
+        (is_duplicate, reason) where reason is 'url', 'title_hash',
+        'fuzzy_title' or None.
+        """
+        conn = self.get_connection()
+        if conn.execute(
+            "SELECT 1 FROM articles WHERE url = ? LIMIT 1", (article.url,)
+        ).fetchone():
+            return True, 'url'
+
+        if conn.execute(
+            "SELECT 1 FROM articles WHERE title_hash = ? LIMIT 1",
+            (compute_title_hash(article.title),)
+        ).fetchone():
+            return True, 'title_hash'
+
+        if self.find_similar_title(article.title):
+            return True, 'fuzzy_title'
+
+        return False, None
+
+    def get_articles(self, limit: int = 50, offset: int = 0,
                     language: Optional[str] = None,
                     source: Optional[str] = None,
                     tags: Optional[List[str]] = None) -> List[Article]:
         """Get articles with filters"""
-        query = "SELECT * FROM articles WHERE 1=1"
+        query = f"SELECT {_ARTICLE_COLUMNS} FROM articles WHERE 1=1"
         params = []
-        
+
         if language:
             query += " AND language = ?"
             params.append(language)
-        
+
         if source:
             query += " AND source = ?"
             params.append(source)
-        
+
         if tags:
-            # Simple tag filtering - could be improved with proper JOIN
-            for tag in tags:
-                query += " AND tags LIKE ?"
-                params.append(f'%"{tag}"%')
-        
+            # Indexed join through article_tags instead of a full-table
+            # LIKE scan over the JSON column; the HAVING clause keeps
+            # only articles carrying every requested tag
+            placeholders = ",".join("?" * len(tags))
+            query = f"""
+                SELECT {_ARTICLE_COLUMNS_PREFIXED} FROM ({query}) a
+                JOIN article_tags at ON at.article_id = a.id
+                JOIN tags t ON t.id = at.tag_id
+                WHERE t.name IN ({placeholders})
+                GROUP BY a.id
+                HAVING COUNT(DISTINCT t.name) = ?
+            """
+            params.extend(tags)
+            params.append(len(tags))
+
         query += " ORDER BY published_date DESC LIMIT ? OFFSET ?"
         params.extend([limit, offset])
-        
-        with self.get_connection() as conn:
-            rows = conn.execute(query, params).fetchall()
-            return [self._row_to_article(row) for row in rows]
-    
+
+        conn = self.get_connection()
+        rows = conn.execute(query, params).fetchall()
+        return [self._row_to_article(row) for row in rows]
+
+    def iter_article_summaries(self, limit: Optional[int] = None):
+        """Lazily yield ArticleSummary rows, newest first.
+
+        Rows stream off the cursor as they are consumed, so the working
+        set stays bounded regardless of how far the caller walks;
+        content and metadata (the fattest columns) are never read.
+        """
+        conn = self.get_connection()
+        sql = """
+            SELECT id, title, source, language, published_date, url,
+                   substr(summary, 1, 100), tags
+            FROM articles
+            ORDER BY published_date DESC
+        """
+        params: tuple = ()
+        if limit is not None:
+            sql += " LIMIT ?"
+            params = (limit,)
+        for row in conn.execute(sql, params):
+            yield ArticleSummary(
+                id=row[0], title=row[1], source=row[2], language=row[3],
+                published_date=row[4], url=row[5], summary=row[6],
+                tags=_json_loads(row[7]) if row[7] else []
+            )
+
+    def list_article_summaries(self, limit: int = 50) -> List['ArticleSummary']:
+        """Latest articles projected to the listing columns only"""
+        return list(self.iter_article_summaries(limit))
+
     def search_articles(self, query: str, limit: int = 50) -> List[Article]:
         """Search articles by title and content"""
-        with self.get_connection() as conn:
+        conn = self.get_connection()
+        try:
+            # Inverted-index lookup; the query is quoted so user input
+            # is a literal phrase, not FTS syntax
+            phrase = '"' + query.replace('"', '""') + '"'
+            rows = conn.execute(f"""
+                SELECT {_ARTICLE_COLUMNS_PREFIXED} FROM articles a
+                JOIN articles_fts f ON f.rowid = a.id
+                WHERE articles_fts MATCH ?
+                ORDER BY a.published_date DESC
+                LIMIT ?
+            """, (phrase, limit)).fetchall()
+        except sqlite3.OperationalError:
+            # FTS table unavailable (old SQLite build): LIKE fallback
+            rows = conn.execute(f"""
+                SELECT {_ARTICLE_COLUMNS} FROM articles
+                WHERE title LIKE ? OR content LIKE ? OR summary LIKE ?
+                ORDER BY published_date DESC
+                LIMIT ?
+            """, (f'%{query}%', f'%{query}%', f'%{query}%', limit)).fetchall()
+        return [self._row_to_article(row) for row in rows]
+
+    def search_article_summaries(self, query: str,
+                                 limit: int = 50) -> List[tuple]:
+        """Search returning (title, source, language, published_date,
+        summary) tuples — a column projection for display paths that
+        never touch content, tags or metadata."""
+        conn = self.get_connection()
+        try:
+            phrase = '"' + query.replace('"', '""') + '"'
+            rows = conn.execute("""
+                SELECT a.title, a.source, a.language, a.published_date,
+                       substr(a.summary, 1, 150)
+                FROM articles a
+                JOIN articles_fts f ON f.rowid = a.id
+                WHERE articles_fts MATCH ?
+                ORDER BY a.published_date DESC
+                LIMIT ?
+            """, (phrase, limit)).fetchall()
+        except sqlite3.OperationalError:
             rows = conn.execute("""
-                SELECT * FROM articles 
+                SELECT title, source, language, published_date,
+                       substr(summary, 1, 150)
+                FROM articles
                 WHERE title LIKE ? OR content LIKE ? OR summary LIKE ?
-                ORDER BY published_date DESC 
+                ORDER BY published_date DESC
                 LIMIT ?
             """, (f'%{query}%', f'%{query}%', f'%{query}%', limit)).fetchall()
-            return [self._row_to_article(row) for row in rows]
-    
+        return [tuple(row) for row in rows]
+
     def save_source(self, source: Source) -> int:
         """Save source to database"""
-        with self.get_connection() as conn:
-            cursor = conn.execute("""
-                INSERT OR REPLACE INTO sources 
-                (name, url, source_type, language, enabled, last_collected,
-                 collection_count, error_count, tags, config)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                source.name,
-                source.url,
-                source.source_type,
-                source.language,
-                source.enabled,
-                source.last_collected,
-                source.collection_count,
-                source.error_count,
-                json.dumps(source.tags),
-                json.dumps(source.config)
-            ))
-            return cursor.lastrowid
-    
-    def get_sources(self, enabled_only: bool = True) -> List[Source]:
-        """Get all sources"""
-        query = "SELECT * FROM sources"
-        if enabled_only:
-            query += " WHERE enabled = 1"
-        
-        with self.get_connection() as conn:
-            rows = conn.execute(query).fetchall()
+        conn = self.get_connection()
+        cursor = conn.execute("""
+            INSERT OR REPLACE INTO sources 
+            (name, url, source_type, language, enabled, last_collected,
+             collection_count, error_count, tags, config)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (
+            source.name,
+            source.url,
+            source.source_type,
+            source.language,
+            source.enabled,
+            source.last_collected,
+            source.collection_count,
+            source.error_count,
+            _json_dumps(source.tags),
+            _json_dumps(source.config)
+        ))
+        # Source definitions changed; rebuild the cache on next read
+        self._sources_cache = None
+        self._sources_by_lang = None
+        return cursor.lastrowid
+
+    def get_sources(self, enabled_only: bool = True,
+                    language: Optional[str] = None) -> List[Source]:
+        """Get all sources (the enabled set is cached until a source is saved)"""
+        if not enabled_only or language:
+            query = f"SELECT {_SOURCE_COLUMNS} FROM sources WHERE 1=1"
+            params = []
+            if enabled_only:
+                query += " AND enabled = 1"
+            if language:
+                query += " AND language = ?"
+                params.append(language)
+            conn = self.get_connection()
+            rows = conn.execute(query, params).fetchall()
             return [self._row_to_source(row) for row in rows]
-    
+
+        if self._sources_cache is None:
+            conn = self.get_connection()
+            rows = conn.execute(f"SELECT {_SOURCE_COLUMNS} FROM sources WHERE enabled = 1").fetchall()
+            self._sources_cache = [self._row_to_source(row) for row in rows]
+            self._sources_by_lang = {}
+            for source in self._sources_cache:
+                self._sources_by_lang.setdefault(source.language, []).append(source)
+
+        return list(self._sources_cache)
+
+    def get_sources_by_language(self, language: str) -> List[Source]:
+        """Get enabled sources for a language via the cached index"""
+        self.get_sources(enabled_only=True)
+        return list(self._sources_by_lang.get(language, []))
+
+    def get_source_by_name(self, name: str) -> Optional[Source]:
+        """Get an enabled source by case-insensitive name"""
+        conn = self.get_connection()
+        row = conn.execute(
+            f"SELECT {_SOURCE_COLUMNS} FROM sources "
+            "WHERE name = ? COLLATE NOCASE AND enabled = 1 LIMIT 1",
+            (name,)
+        ).fetchone()
+        return self._row_to_source(row) if row else None
+
     def save_tag(self, tag: Tag) -> int:
         """Save tag to database"""
-        with self.get_connection() as conn:
-            cursor = conn.execute("""
-                INSERT OR REPLACE INTO tags 
-                (name, category, description, color, usage_count, created_date)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, (
-                tag.name,
-                tag.category,
-                tag.description,
-                tag.color,
-                tag.usage_count,
-                tag.created_date
-            ))
-            return cursor.lastrowid
-    
-    def get_tags(self) -> List[Tag]:
-        """Get all tags"""
-        with self.get_connection() as conn:
-            rows = conn.execute("SELECT * FROM tags ORDER BY usage_count DESC").fetchall()
-            return [self._row_to_tag(row) for row in rows]
-    
+        conn = self.get_connection()
+        cursor = conn.execute("""
+            INSERT OR REPLACE INTO tags 
+            (name, category, description, color, usage_count, created_date)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, (
+            tag.name,
+            tag.category,
+            tag.description,
+            tag.color,
+            tag.usage_count,
+            tag.created_date
+        ))
+        return cursor.lastrowid
+
+    def get_tags(self, limit: Optional[int] = None) -> List[Tag]:
+        """Get tags by descending usage, optionally only the top N"""
+        conn = self.get_connection()
+        query = f"SELECT {_TAG_COLUMNS} FROM tags ORDER BY usage_count DESC"
+        params = ()
+        if limit is not None:
+            query += " LIMIT ?"
+            params = (limit,)
+        rows = conn.execute(query, params).fetchall()
+        return [self._row_to_tag(row) for row in rows]
+
+    def get_cached_summary(self, content_hash: str) -> Optional[str]:
+        """Look up a previously generated summary by content fingerprint"""
+        conn = self.get_connection()
+        row = conn.execute(
+            "SELECT summary FROM summary_cache WHERE content_hash = ?",
+            (content_hash,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def cache_summary(self, content_hash: str, summary: str, model: str):
+        """Store a generated summary under its content fingerprint"""
+        conn = self.get_connection()
+        conn.execute("""
+            INSERT OR IGNORE INTO summary_cache (content_hash, summary, model)
+            VALUES (?, ?, ?)
+        """, (content_hash, summary, model))
+
     def save_collection_log(self, log: CollectionLog) -> int:
         """Save collection log"""
-        with self.get_connection() as conn:
-            cursor = conn.execute("""
-                INSERT INTO collection_logs 
+        conn = self.get_connection()
+        cursor = conn.execute("""
+            INSERT INTO collection_logs 
+            (source_id, collection_date, articles_found, articles_processed,
+             articles_new, errors, duration_seconds, status)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """, (
+            log.source_id,
+            log.collection_date,
+            log.articles_found,
+            log.articles_processed,
+            log.articles_new,
+            _json_dumps(log.errors),
+            log.duration_seconds,
+            log.status
+        ))
+        return cursor.lastrowid
+
+    def save_collection_logs(self, logs: List[CollectionLog]) -> int:
+        """Save many collection logs with one executemany in one transaction"""
+        if not logs:
+            return 0
+        rows = (
+            (
+                log.source_id, log.collection_date, log.articles_found,
+                log.articles_processed, log.articles_new,
+                _json_dumps(log.errors), log.duration_seconds, log.status
+            )
+            for log in logs
+        )
+        with self.transaction() as conn:
+            conn.executemany("""
+                INSERT INTO collection_logs
                 (source_id, collection_date, articles_found, articles_processed,
                  articles_new, errors, duration_seconds, status)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                log.source_id,
-                log.collection_date,
-                log.articles_found,
-                log.articles_processed,
-                log.articles_new,
-                json.dumps(log.errors),
-                log.duration_seconds,
-                log.status
-            ))
-            return cursor.lastrowid
-    
-    def get_collection_stats(self, days: int = 7) -> Dict[str, Any]:
-        """Get collection statistics"""
-        with self.get_connection() as conn:
-            # Total articles collected in the last N days
-            total_articles = conn.execute("""
-                SELECT COUNT(*) FROM articles 
-                WHERE collected_date >= datetime('now', '-{} days')
-            """.format(days)).fetchone()[0]
-            
-            # Articles by language
-            lang_stats = conn.execute("""
-                SELECT language, COUNT(*) as count FROM articles 
-                WHERE collected_date >= datetime('now', '-{} days')
-                GROUP BY language
-            """.format(days)).fetchall()
-            
-            # Articles by source
-            source_stats = conn.execute("""
-                SELECT source, COUNT(*) as count FROM articles 
-                WHERE collected_date >= datetime('now', '-{} days')
-                GROUP BY source
-                ORDER BY count DESC
-                LIMIT 10
-            """.format(days)).fetchall()
-            
+            """, rows)
+        return len(logs)
+
+    def get_collection_stats(self, days: int = 7,
+                             top_sources: int = 10) -> Dict[str, Any]:
+        """Get collection statistics (top_sources caps the source list)"""
+        # Bind the window as a parameter so the statement text is stable
+        # (cached plan, no injection surface)
+        window = (f'-{int(days)} days',)
+
+        with self.read_snapshot() as conn:
+            # One range scan over the window: group by (language, source)
+            # and derive the total and both breakdowns in Python
+            total_articles = 0
+            languages: Dict[str, int] = {}
+            source_counts: Dict[str, int] = {}
+            for language, source, count in conn.execute("""
+                SELECT language, source, COUNT(*) as count FROM articles
+                WHERE collected_date >= datetime('now', ?)
+                GROUP BY language, source
+            """, window):
+                total_articles += count
+                languages[language] = languages.get(language, 0) + count
+                source_counts[source] = source_counts.get(source, 0) + count
+
             # Collection success rate
             success_rate = conn.execute("""
-                SELECT 
+                SELECT
                     COUNT(CASE WHEN status = 'success' THEN 1 END) * 100.0 / COUNT(*) as rate
-                FROM collection_logs 
-                WHERE collection_date >= datetime('now', '-{} days')
-            """.format(days)).fetchone()[0] or 0
-            
-            return {
-                'total_articles': total_articles,
-                'languages': dict(lang_stats),
-                'top_sources': dict(source_stats),
-                'success_rate': round(success_rate, 2),
-                'period_days': days
-            }
-    
+                FROM collection_logs
+                WHERE collection_date >= datetime('now', ?)
+            """, window).fetchone()[0] or 0
+
+        source_stats = sorted(
+            source_counts.items(), key=lambda item: item[1], reverse=True
+        )[:top_sources]
+
+        return {
+            'total_articles': total_articles,
+            'languages': languages,
+            'top_sources': dict(source_stats),
+            'success_rate': round(success_rate, 2),
+            'period_days': days
+        }
+
     def cleanup_old_articles(self, days: int = 30) -> int:
         """Remove articles older than specified days"""
-        with self.get_connection() as conn:
-            cursor = conn.execute("""
-                DELETE FROM articles 
-                WHERE collected_date < datetime('now', '-{} days')
-            """.format(days))
-            return cursor.rowcount
-    
+        conn = self.get_connection()
+        cursor = conn.execute("""
+            DELETE FROM articles
+            WHERE collected_date < datetime('now', ?)
+        """, (f'-{int(days)} days',))
+        return cursor.rowcount
+
     def _row_to_article(self, row) -> Article:
-        """Convert database row to Article object"""
+        """Convert database row to Article object (positional unpack;
+        TIMESTAMP columns arrive pre-converted)"""
+        (article_id, title, url, content, summary, language, source, author,
+         published_date, collected_date, tags, metadata, _title_hash) = row
         return Article(
-            id=row['id'],
-            title=row['title'],
-            url=row['url'],
-            content=row['content'],
-            summary=row['summary'],
-            language=row['language'],
-            source=row['source'],
-            author=row['author'],
-            published_date=datetime.fromisoformat(row['published_date']) if row['published_date'] else None,
-            collected_date=datetime.fromisoformat(row['collected_date']) if row['collected_date'] else None,
-            tags=json.loads(row['tags']) if row['tags'] else [],
-            metadata=json.loads(row['metadata']) if row['metadata'] else {}
+            id=article_id,
+            title=title,
+            url=url,
+            content=content,
+            summary=summary,
+            language=language,
+            source=source,
+            author=author,
+            published_date=published_date,
+            collected_date=collected_date,
+            tags=_json_loads(tags) if tags else [],
+            metadata=_json_loads(metadata) if metadata else {}
         )
-    
+
     def _row_to_source(self, row) -> Source:
         """Convert database row to Source object"""
+        (source_id, name, url, source_type, language, enabled,
+         last_collected, collection_count, error_count, tags, config) = row
         return Source(
-            id=row['id'],
-            name=row['name'],
-            url=row['url'],
-            source_type=row['source_type'],
-            language=row['language'],
-            enabled=bool(row['enabled']),
-            last_collected=datetime.fromisoformat(row['last_collected']) if row['last_collected'] else None,
-            collection_count=row['collection_count'],
-            error_count=row['error_count'],
-            tags=json.loads(row['tags']) if row['tags'] else [],
-            config=json.loads(row['config']) if row['config'] else {}
+            id=source_id,
+            name=name,
+            url=url,
+            source_type=source_type,
+            language=language,
+            enabled=bool(enabled),
+            last_collected=last_collected,
+            collection_count=collection_count,
+            error_count=error_count,
+            tags=_json_loads(tags) if tags else [],
+            config=_json_loads(config) if config else {}
         )
-    
+
     def _row_to_tag(self, row) -> Tag:
         """Convert database row to Tag object"""
+        tag_id, name, category, description, color, usage_count, created_date = row
         return Tag(
-            id=row['id'],
-            name=row['name'],
-            category=row['category'],
-            description=row['description'],
-            color=row['color'],
-            usage_count=row['usage_count'],
-            created_date=datetime.fromisoformat(row['created_date']) if row['created_date'] else None
+            id=tag_id,
+            name=name,
+            category=category,
+            description=description,
+            color=color,
+            usage_count=usage_count,
+            created_date=created_date
         )
@@ -4,10 +4,18 @@ Slack bot integration for AI News Bot
 
 from typing import Dict, Any, List, Optional
 import logging
+import queue
+import re
+import ssl
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import json
 
 from slack_sdk import WebClient
+from slack_sdk.errors import SlackApiError
 from slack_sdk.socket_mode import SocketModeClient
 from slack_sdk.socket_mode.request import SocketModeRequest
 from slack_sdk.socket_mode.response import SocketModeResponse
@@ -18,6 +26,78 @@ from ..utils.config import get_slack_config
 logger = logging.getLogger(__name__)
 
 
+class _TTLCache:
+    """Small thread-safe TTL cache with LRU eviction"""
+
+    def __init__(self, maxsize: int = 128, ttl: float = 300.0):
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self._maxsize = maxsize
+        self._ttl = ttl
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = (time.monotonic() + self._ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+def _fmt_date(d) -> Optional[str]:
+    """YYYY-MM-DD without strftime's per-call format-string parsing"""
+    if d is None:
+        return None
+    return d.date().isoformat() if hasattr(d, 'date') else d.isoformat()
+
+# Shared between (and within) block payloads; never mutated
+_DIVIDER = {"type": "divider"}
+
+_HELP_TEXT = """🤖 *AI News Bot Commands:*
+
+• `/ai-news search <keyword>` - Search for articles
+• `/ai-news latest [count]` - Show latest articles (default: 5)
+• `/ai-news tags` - List available tags
+• `/ai-news sources` - List news sources
+• `/ai-news stats` - Show collection statistics
+• `/ai-news refresh` - Clear the cached responses
+
+*Examples:*
+• `/ai-news search GPT-4`
+• `/ai-news latest 10`"""
+
+# Rendered slash-command responses; tags/sources/stats move on
+# minute-to-hour scale, so repeat commands become one dict lookup
+_RESPONSE_CACHE = _TTLCache(maxsize=128, ttl=300.0)
+
+# Rendered search results keyed by normalized query, so "GPT-4",
+# "gpt 4" and "gpt-4" share one FTS scan; longer TTL than the response
+# cache since the corpus only grows between collection cycles
+_SEARCH_CACHE = _TTLCache(maxsize=256, ttl=900.0)
+
+_QUERY_NORM = re.compile(r"[^\w]+")
+
+
+def _normalize_query(query: str) -> str:
+    """Lowercase, strip punctuation, collapse whitespace"""
+    return _QUERY_NORM.sub(" ", query.lower()).strip()
+
+
 class AINewsSlackBot:
     """Slack bot for AI news sharing and interaction"""
     
@@ -25,8 +105,17 @@ class AINewsSlackBot:
         self.config = get_slack_config(config)
         self.db = db
         
-        # Initialize Slack clients
-        self.web_client = WebClient(token=self.config['bot_token'])
+        # Initialize Slack clients. A single SSLContext is built once
+        # and shared across requests: loading the CA bundle is the slow
+        # part of each TLS handshake, and keep-alive lets consecutive
+        # posts (alert batches, digests) reuse the connection.
+        self._ssl_context = ssl.create_default_context()
+        self.web_client = WebClient(
+            token=self.config['bot_token'],
+            ssl=self._ssl_context,
+            timeout=10,
+            headers={"Connection": "keep-alive"},
+        )
         
         # Socket mode for slash commands (optional)
         if self.config.get('app_token'):
@@ -38,10 +127,37 @@ class AINewsSlackBot:
         else:
             self.socket_client = None
         
+        # O(1) subcommand dispatch shared by the socket-mode and
+        # channel-posting paths, so formatting lives in one place
+        self._subcommands = {
+            "search": self._sub_search,
+            "latest": self._sub_latest,
+            "tags": self._sub_tags,
+            "sources": self._sub_sources,
+            "stats": self._sub_stats,
+        }
+
+        # Socket requests are handed off here so the gateway listener
+        # thread never blocks on DB queries or Slack API round-trips;
+        # a burst of slash commands is served concurrently
+        self._handler_executor = ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix='slack-handler'
+        )
+
         # Configuration
         self.main_channel = self.config.get('channels', {}).get('main', '#ai-news')
         self.alerts_channel = self.config.get('channels', {}).get('alerts', '#ai-news-alerts')
         self.max_articles_per_post = self.config.get('posting', {}).get('max_articles_per_post', 5)
+
+        # Alerts are coalesced: a burst becomes one chat.postMessage
+        # instead of tripping Slack's per-method rate limit
+        self._alert_queue: queue.Queue = queue.Queue()
+        self._alert_batch_size = 20
+        self._alert_flush_window = 1.0  # seconds to wait for more alerts
+        self._alert_worker = threading.Thread(
+            target=self._drain_alert_queue, daemon=True, name='slack-alerts'
+        )
+        self._alert_worker.start()
         
     def start_socket_mode(self):
         """Start socket mode for real-time interactions"""
@@ -65,79 +181,66 @@ class AINewsSlackBot:
         pass
     
     def _handle_socket_request(self, client: SocketModeClient, req: SocketModeRequest):
-        """Handle incoming socket mode requests"""
+        """Ack immediately, then run the real work off the listener thread.
+
+        Slack re-delivers slash commands not acknowledged within 3
+        seconds, so the ack (a single websocket send) happens before
+        any DB or API work is queued.
+        """
+        if req.type == "slash_commands":
+            try:
+                client.send_socket_mode_response(SocketModeResponse(
+                    envelope_id=req.envelope_id,
+                    payload={
+                        "response_type": "ephemeral",
+                        "text": "⏳ Working on it..."
+                    }
+                ))
+            except Exception as e:
+                logger.error("Failed to acknowledge slash command: %s", e)
+            self._handler_executor.submit(self._do_slash_work, req)
+        else:
+            self._handler_executor.submit(self._process_socket_request, client, req)
+
+    def _process_socket_request(self, client: SocketModeClient, req: SocketModeRequest):
+        """Handle non-slash socket mode requests"""
         try:
-            if req.type == "slash_commands":
-                # Handle slash command and respond directly via Socket Mode ONLY
-                self._handle_slash_command_with_response(req, client)
-                # Do NOT call the old _handle_slash_command method
-            elif req.type == "events_api":
+            if req.type == "events_api":
                 self._handle_event(req)
-            else:
-                # Acknowledge the request
+        except Exception as e:
+            logger.error("Error handling socket request: %s", e)
+        finally:
+            # Always acknowledge so Slack doesn't re-deliver
+            try:
                 response = SocketModeResponse(envelope_id=req.envelope_id)
                 client.send_socket_mode_response(response)
-            
-        except Exception as e:
-            logger.error(f"Error handling socket request: {e}")
-            # Still acknowledge even on error
-            response = SocketModeResponse(envelope_id=req.envelope_id)
-            client.send_socket_mode_response(response)
-    
-    def _handle_slash_command_with_response(self, req: SocketModeRequest, client: SocketModeClient):
-        """Handle slash commands and respond directly via Socket Mode"""
+            except Exception as e:
+                logger.error("Failed to acknowledge socket request: %s", e)
+
+    def _do_slash_work(self, req: SocketModeRequest):
+        """Build and post the response for an already-acked slash command"""
         command = req.payload.get("command", "")
         text = req.payload.get("text", "")
         channel_id = req.payload.get("channel_id", "")
-        user_id = req.payload.get("user_id", "")
-        
-        logger.info(f"Received slash command: {command} {text}")
-        
-        # Generate response content
-        response_text = ""
-        
+
+        logger.info("Received slash command: %s %s", command, text)
+
         if command == "/ai-news":
-            try:
-                response_text = self._generate_ai_news_response(text)
-                logger.info(f"Generated response for {command} {text}")
-            except Exception as e:
-                logger.error(f"Error generating response: {e}")
-                response_text = f"Sorry, there was an error processing your request: {str(e)}"
+            response_text = self._generate_ai_news_response(text)
         else:
             response_text = "Unknown command"
-        
-        # Send response via Socket Mode
-        try:
-            response = SocketModeResponse(
-                envelope_id=req.envelope_id,
-                payload={
-                    "text": response_text,
-                    "response_type": "in_channel"  # Make response visible to everyone
-                }
-            )
-            client.send_socket_mode_response(response)
-            logger.info(f"Sent Socket Mode response for {command}")
-        except Exception as e:
-            logger.error(f"Failed to send Socket Mode response: {e}")
-    
-    def _handle_slash_command(self, req: SocketModeRequest):
-        """Handle slash commands"""
-        command = req.payload.get("command", "")
-        text = req.payload.get("text", "")
-        channel_id = req.payload.get("channel_id", "")
-        user_id = req.payload.get("user_id", "")
-        
-        logger.info(f"Received slash command: {command} {text}")
-        
-        if command == "/ai-news":
-            self._handle_ai_news_command(text, channel_id, user_id)
+
+        if self._send_message(channel_id, response_text):
+            logger.info("Posted response for %s", command)
+        else:
+            logger.error("Failed to post response for %s", command)
     
     def _handle_event(self, req: SocketModeRequest):
         """Handle events API requests"""
         event = req.payload.get("event", {})
         event_type = event.get("type", "")
         
-        logger.info(f"Received event: {event_type}")
+        logger.info("Received event: %s", event_type)
         
         if event_type == "app_mention":
             # Handle app mentions if needed
@@ -146,303 +249,153 @@ class AINewsSlackBot:
             # Handle messages if needed
             pass
     
-    def _handle_ai_news_command(self, text: str, channel_id: str, user_id: str):
-        """Handle /ai-news slash command"""
+    def _generate_ai_news_response(self, text: str) -> str:
+        """Generate response for AI news commands (cached per command)"""
         parts = text.strip().split() if text else []
-        
-        if not parts:
-            self._send_help_message(channel_id)
-            return
-        
-        subcommand = parts[0].lower()
-        
-        if subcommand == "search":
-            query = " ".join(parts[1:]) if len(parts) > 1 else ""
-            self._handle_search_command(query, channel_id)
-        
-        elif subcommand == "latest":
-            count = int(parts[1]) if len(parts) > 1 and parts[1].isdigit() else 5
-            self._handle_latest_command(count, channel_id)
-        
-        elif subcommand == "tags":
-            self._handle_tags_command(channel_id)
-        
-        elif subcommand == "sources":
-            self._handle_sources_command(channel_id)
-        
-        elif subcommand == "stats":
-            self._handle_stats_command(channel_id)
-        
-        else:
-            self._send_help_message(channel_id)
-    
-    def _handle_search_command(self, query: str, channel_id: str):
-        """Handle search command"""
-        if not query:
-            self._send_message(channel_id, "Please provide a search query. Example: `/ai-news search GPT`")
-            return
-        
-        try:
-            articles = self.db.search_articles(query, limit=10)
-            
-            if not articles:
-                self._send_message(channel_id, f"No articles found for query: '{query}'")
-                return
-            
-            # Format search results
-            blocks = self._format_search_results(articles, query)
-            self._send_blocks(channel_id, blocks)
-            
-        except Exception as e:
-            logger.error(f"Search command failed: {e}")
-            self._send_message(channel_id, "Search failed. Please try again later.")
-    
-    def _handle_latest_command(self, count: int, channel_id: str):
-        """Handle latest articles command"""
-        try:
-            articles = self.db.get_articles(limit=min(count, 10))
-            
-            if not articles:
-                self._send_message(channel_id, "No recent articles found.")
-                return
-            
-            blocks = self._format_articles_summary(articles, f"Latest {len(articles)} Articles")
-            self._send_blocks(channel_id, blocks)
-            
-        except Exception as e:
-            logger.error(f"Latest command failed: {e}")
-            self._send_message(channel_id, "Failed to fetch latest articles.")
-    
-    def _handle_tags_command(self, channel_id: str):
-        """Handle tags listing command"""
-        try:
-            tags = self.db.get_tags()
-            
-            if not tags:
-                self._send_message(channel_id, "No tags found.")
-                return
-            
-            # Group tags by category
-            tag_text = "📋 *Available Tags:*\n\n"
-            
-            categories = {}
-            for tag in tags[:20]:  # Limit to top 20 tags
-                category = tag.category or 'general'
-                if category not in categories:
-                    categories[category] = []
-                categories[category].append(f"`{tag.name}` ({tag.usage_count})")
-            
-            for category, tag_list in categories.items():
-                tag_text += f"*{category.title()}:* {', '.join(tag_list)}\n"
-            
-            self._send_message(channel_id, tag_text)
-            
-        except Exception as e:
-            logger.error(f"Tags command failed: {e}")
-            self._send_message(channel_id, "Failed to fetch tags.")
-    
-    def _handle_sources_command(self, channel_id: str):
-        """Handle sources listing command"""
-        try:
-            sources = self.db.get_sources(enabled_only=False)
-            
-            if not sources:
-                self._send_message(channel_id, "No sources configured.")
-                return
-            
-            source_text = "📰 *News Sources:*\n\n"
-            
-            # Group by language
-            languages = {}
-            for source in sources:
-                lang = source.language or 'unknown'
-                if lang not in languages:
-                    languages[lang] = []
-                
-                status = "✅" if source.enabled else "❌"
-                languages[lang].append(f"{status} {source.name} ({source.source_type})")
-            
-            for lang, source_list in languages.items():
-                source_text += f"*{lang.title()}:*\n"
-                source_text += "\n".join(source_list) + "\n\n"
-            
-            self._send_message(channel_id, source_text)
-            
-        except Exception as e:
-            logger.error(f"Sources command failed: {e}")
-            self._send_message(channel_id, "Failed to fetch sources.")
-    
-    def _handle_stats_command(self, channel_id: str):
-        """Handle statistics command"""
+        subcommand = parts[0].lower() if parts else ""
+
+        if subcommand == "refresh":
+            _RESPONSE_CACHE.clear()
+            _SEARCH_CACHE.clear()
+            return "🔄 Response cache cleared."
+
+        cache_key = (subcommand, " ".join(parts[1:]))
+        cached = _RESPONSE_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
-            stats = self.db.get_collection_stats(days=7)
-            
-            stats_text = "📊 *Collection Statistics (Last 7 Days):*\n\n"
-            stats_text += f"• Total Articles: {stats['total_articles']}\n"
-            stats_text += f"• Success Rate: {stats['success_rate']}%\n\n"
-            
-            if stats['languages']:
-                stats_text += "*By Language:*\n"
-                for lang, count in stats['languages'].items():
-                    stats_text += f"• {lang}: {count}\n"
-                stats_text += "\n"
-            
-            if stats['top_sources']:
-                stats_text += "*Top Sources:*\n"
-                for source, count in list(stats['top_sources'].items())[:5]:
-                    stats_text += f"• {source}: {count}\n"
-            
-            self._send_message(channel_id, stats_text)
-            
+            response = self._build_ai_news_response(parts)
         except Exception as e:
-            logger.error(f"Stats command failed: {e}")
-            self._send_message(channel_id, "Failed to fetch statistics.")
-    
-    def _generate_ai_news_response(self, text: str) -> str:
-        """Generate response for AI news commands"""
-        parts = text.strip().split() if text else []
-        
+            # Errors are returned but never cached
+            logger.error("Error generating response: %s", e)
+            return f"Sorry, there was an error processing your request: {str(e)}"
+
+        _RESPONSE_CACHE.set(cache_key, response)
+        return response
+
+    def _build_ai_news_response(self, parts: List[str]) -> str:
+        """Dispatch a parsed /ai-news command to its subcommand handler"""
         if not parts:
-            return """🤖 *AI News Bot Commands:*
+            return _HELP_TEXT
+        handler = self._subcommands.get(parts[0].lower(), self._sub_help)
+        return handler(parts[1:])
 
-• `/ai-news search <keyword>` - Search for articles
-• `/ai-news latest [count]` - Show latest articles (default: 5)
-• `/ai-news tags` - List available tags
-• `/ai-news sources` - List news sources
-• `/ai-news stats` - Show collection statistics
+    def _sub_help(self, args: List[str]) -> str:
+        """Fallback for unknown or missing subcommands"""
+        return _HELP_TEXT
 
-*Examples:*
-• `/ai-news search GPT-4`
-• `/ai-news latest 10`"""
-        
-        subcommand = parts[0].lower()
-        
-        try:
-            if subcommand == "search":
-                query = " ".join(parts[1:]) if len(parts) > 1 else ""
-                if not query:
-                    return "Please provide a search query. Example: `/ai-news search GPT`"
-                
-                articles = self.db.search_articles(query, limit=5)
-                if not articles:
-                    return f"No articles found for query: '{query}'"
-                
-                response = f"🔍 *Search Results for '{query}':*\n\n"
-                for i, article in enumerate(articles, 1):
-                    response += f"{i}. *{article.title}*\n"
-                    response += f"   📰 {article.source} | 📅 {article.published_date.strftime('%Y-%m-%d') if article.published_date else 'Unknown'}\n"
-                    response += f"   {article.summary[:150]}...\n"
-                    response += f"   🔗 {article.url}\n\n"
-                return response
-            
-            elif subcommand == "latest":
-                count = int(parts[1]) if len(parts) > 1 and parts[1].isdigit() else 5
-                articles = self.db.get_articles(limit=min(count, 10))
-                
-                if not articles:
-                    return "No recent articles found."
-                
-                response = f"📰 *Latest {len(articles)} Articles:*\n\n"
-                for i, article in enumerate(articles, 1):
-                    response += f"{i}. *{article.title}*\n"
-                    response += f"   📰 {article.source} | 📅 {article.published_date.strftime('%Y-%m-%d') if article.published_date else 'Unknown'}\n"
-                    response += f"   {article.summary[:150]}...\n"
-                    response += f"   🔗 {article.url}\n\n"
-                return response
-            
-            elif subcommand == "sources":
-                sources = self.db.get_sources(enabled_only=False)
-                if not sources:
-                    return "No sources configured."
-                
-                response = "📰 *News Sources:*\n\n"
-                languages = {}
-                for source in sources:
-                    lang = source.language or 'unknown'
-                    if lang not in languages:
-                        languages[lang] = []
-                    
-                    status = "✅" if source.enabled else "❌"
-                    languages[lang].append(f"{status} {source.name} ({source.source_type})")
-                
-                for lang, source_list in languages.items():
-                    response += f"*{lang.title()}:*\n"
-                    response += "\n".join(source_list) + "\n\n"
-                
-                return response
-            
-            elif subcommand == "tags":
-                tags = self.db.get_tags()
-                if not tags:
-                    return "No tags found."
-                
-                response = "📋 *Available Tags:*\n\n"
-                categories = {}
-                for tag in tags[:20]:
-                    category = tag.category or 'general'
-                    if category not in categories:
-                        categories[category] = []
-                    categories[category].append(f"`{tag.name}` ({tag.usage_count})")
-                
-                for category, tag_list in categories.items():
-                    response += f"*{category.title()}:* {', '.join(tag_list)}\n"
-                
-                return response
-            
-            elif subcommand == "stats":
-                stats = self.db.get_collection_stats(days=7)
-                
-                response = "📊 *Collection Statistics (Last 7 Days):*\n\n"
-                response += f"• Total Articles: {stats['total_articles']}\n"
-                response += f"• Success Rate: {stats['success_rate']}%\n\n"
-                
-                if stats['languages']:
-                    response += "*By Language:*\n"
-                    for lang, count in stats['languages'].items():
-                        response += f"• {lang}: {count}\n"
-                    response += "\n"
-                
-                if stats['top_sources']:
-                    response += "*Top Sources:*\n"
-                    for source, count in list(stats['top_sources'].items())[:5]:
-                        response += f"• {source}: {count}\n"
-                
-                return response
-            
-            else:
-                return """🤖 *AI News Bot Commands:*
+    def _sub_search(self, args: List[str]) -> str:
+        """`/ai-news search <keyword>`"""
+        query = " ".join(args)
+        if not query:
+            return "Please provide a search query. Example: `/ai-news search GPT`"
+        norm = _normalize_query(query)
+        cached = _SEARCH_CACHE.get(norm)
+        if cached is not None:
+            return cached
+        articles = self.db.search_articles(query, limit=5)
+        if not articles:
+            return f"No articles found for query: '{query}'"
+        response = (f"🔍 *Search Results for '{query}':*\n\n"
+                    + self._format_article_list(articles))
+        _SEARCH_CACHE.set(norm, response)
+        return response
 
-• `/ai-news search <keyword>` - Search for articles
-• `/ai-news latest [count]` - Show latest articles (default: 5)
-• `/ai-news tags` - List available tags
-• `/ai-news sources` - List news sources
-• `/ai-news stats` - Show collection statistics
+    def _sub_latest(self, args: List[str]) -> str:
+        """`/ai-news latest [count]`"""
+        count = int(args[0]) if args and args[0].isdigit() else 5
+        articles = self.db.get_articles(limit=min(count, 10))
+        if not articles:
+            return "No recent articles found."
+        return (f"📰 *Latest {len(articles)} Articles:*\n\n"
+                + self._format_article_list(articles))
 
-*Examples:*
-• `/ai-news search GPT-4`
-• `/ai-news latest 10`"""
-        
-        except Exception as e:
-            logger.error(f"Error generating response: {e}")
-            return f"Sorry, there was an error processing your request: {str(e)}"
-    
-    def _send_help_message(self, channel_id: str):
-        """Send help message"""
-        help_text = """
-🤖 *AI News Bot Commands:*
+    def _sub_tags(self, args: List[str]) -> str:
+        """`/ai-news tags`"""
+        tags = self.db.get_tags(limit=20)
+        if not tags:
+            return "No tags found."
+        return self._format_tags_text(tags)
 
-• `/ai-news search <keyword>` - Search for articles
-• `/ai-news latest [count]` - Show latest articles (default: 5)
-• `/ai-news tags` - List available tags
-• `/ai-news sources` - List news sources
-• `/ai-news stats` - Show collection statistics
+    def _sub_sources(self, args: List[str]) -> str:
+        """`/ai-news sources`"""
+        sources = self.db.get_sources(enabled_only=False)
+        if not sources:
+            return "No sources configured."
+        return self._format_sources_text(sources)
+
+    def _sub_stats(self, args: List[str]) -> str:
+        """`/ai-news stats`"""
+        return self._format_stats_text(
+            self.db.get_collection_stats(days=7, top_sources=5)
+        )
+
+    def _format_article_list(self, articles: List[Article]) -> str:
+        """Numbered article list shared by the search and latest responses"""
+        parts = []
+        for i, article in enumerate(articles, 1):
+            # Bind each attribute once per iteration; the chains would
+            # otherwise be re-resolved for every f-string field
+            published = article.published_date
+            date = _fmt_date(published) or 'Unknown'
+            summary = (article.summary or "")[:150]
+            parts.append(
+                f"{i}. *{article.title}*\n"
+                f"   📰 {article.source} | 📅 {date}\n"
+                f"   {summary}...\n"
+                f"   🔗 {article.url}\n\n"
+            )
+        return "".join(parts)
+
+    def _format_tags_text(self, tags: List) -> str:
+        """Tag listing grouped by category"""
+        parts = ["📋 *Available Tags:*\n\n"]
+        categories = {}
+        for tag in tags:  # caller limits to the top 20 by usage
+            categories.setdefault(tag.category or 'general', []).append(
+                f"`{tag.name}` ({tag.usage_count})"
+            )
+        for category, tag_list in categories.items():
+            parts.append(f"*{category.title()}:* {', '.join(tag_list)}\n")
+        return "".join(parts)
+
+    def _format_sources_text(self, sources: List) -> str:
+        """Source listing grouped by language"""
+        parts = ["📰 *News Sources:*\n\n"]
+        languages = {}
+        for source in sources:
+            status = "✅" if source.enabled else "❌"
+            languages.setdefault(source.language or 'unknown', []).append(
+                f"{status} {source.name} ({source.source_type})"
+            )
+        for lang, source_list in languages.items():
+            parts.append(f"*{lang.title()}:*\n")
+            parts.append("\n".join(source_list) + "\n\n")
+        return "".join(parts)
+
+    def _format_stats_text(self, stats: Dict[str, Any]) -> str:
+        """Collection statistics summary"""
+        parts = [
+            "📊 *Collection Statistics (Last 7 Days):*\n\n",
+            f"• Total Articles: {stats['total_articles']}\n",
+            f"• Success Rate: {stats['success_rate']}%\n\n",
+        ]
+        if stats['languages']:
+            parts.append("*By Language:*\n")
+            parts.extend(
+                f"• {lang}: {count}\n"
+                for lang, count in stats['languages'].items()
+            )
+            parts.append("\n")
+        if stats['top_sources']:
+            parts.append("*Top Sources:*\n")
+            parts.extend(
+                f"• {source}: {count}\n"
+                for source, count in stats['top_sources'].items()
+            )
+        return "".join(parts)
 
-*Examples:*
-• `/ai-news search GPT-4`
-• `/ai-news latest 10`
-"""
-        self._send_message(channel_id, help_text)
-    
     def post_articles_summary(self, articles: List[Article], title: str = "AI News Update") -> bool:
         """Post articles summary to main channel"""
         try:
@@ -460,44 +413,115 @@ class AINewsSlackBot:
             response = self._send_blocks(self.main_channel, blocks)
             
             if response:
-                logger.info(f"Posted {len(articles_to_post)} articles to {self.main_channel}")
+                logger.info("Posted %d articles to %s", len(articles_to_post), self.main_channel)
                 return True
             else:
                 logger.error("Failed to post articles to Slack")
                 return False
                 
         except Exception as e:
-            logger.error(f"Failed to post articles summary: {e}")
+            logger.error("Failed to post articles summary: %s", e)
             return False
-    
-    def send_alert(self, message: str, level: str = "info") -> bool:
-        """Send alert message to alerts channel"""
+
+    def post_articles_paged(self, articles: List[Article], title: str = "AI News Update") -> bool:
+        """Post all articles as paged messages, instead of truncating.
+
+        post_articles_summary silently drops everything past
+        max_articles_per_post; here the batch is split into pages (each
+        article emits up to 3 blocks, so pages stay well under Slack's
+        50-block message ceiling) posted with 1s spacing — Slack's
+        recommended chat.postMessage pacing — so a 30-article cycle
+        becomes a handful of messages instead of 30 API calls.
+        """
         try:
-            emoji_map = {
-                "info": "ℹ️",
-                "warning": "⚠️",
-                "error": "❌",
-                "success": "✅"
-            }
-            
-            emoji = emoji_map.get(level, "ℹ️")
-            formatted_message = f"{emoji} *Alert:* {message}"
-            
-            response = self._send_message(self.alerts_channel, formatted_message)
-            
-            if response:
-                logger.info(f"Sent alert to {self.alerts_channel}: {message}")
+            if not articles:
+                logger.info("No articles to post")
                 return True
-            else:
-                logger.error("Failed to send alert to Slack")
-                return False
-                
+
+            per_page = min(self.max_articles_per_post, 10)
+            pages = [
+                articles[i:i + per_page]
+                for i in range(0, len(articles), per_page)
+            ]
+            total = len(pages)
+            ok = True
+
+            for page_num, page in enumerate(pages, 1):
+                page_title = title if total == 1 else f"{title} ({page_num}/{total})"
+                blocks = self._format_articles_summary(page, page_title)
+                if not self._send_blocks(self.main_channel, blocks):
+                    logger.error("Failed to post page %d/%d to Slack", page_num, total)
+                    ok = False
+                if page_num < total:
+                    time.sleep(1.0)
+
+            if ok:
+                logger.info(
+                    "Posted %d articles in %d page(s) to %s",
+                    len(articles), total, self.main_channel
+                )
+            return ok
+
         except Exception as e:
-            logger.error(f"Failed to send alert: {e}")
+            logger.error("Failed to post paged articles: %s", e)
             return False
+
+    _ALERT_EMOJI = {
+        "info": "ℹ️",
+        "warning": "⚠️",
+        "error": "❌",
+        "success": "✅"
+    }
+
+    def send_alert(self, message: str, level: str = "info") -> bool:
+        """Queue an alert for the alerts channel (posted coalesced)"""
+        self._alert_queue.put((level, message))
+        return True
+
+    def _drain_alert_queue(self):
+        """Flush queued alerts, coalescing bursts into one message.
+
+        Blocks until an alert arrives, then holds the bus for up to
+        _alert_flush_window seconds (or _alert_batch_size alerts) so a
+        burst of producer errors becomes a single chat.postMessage.
+        """
+        while True:
+            alerts = [self._alert_queue.get()]
+            deadline = time.monotonic() + self._alert_flush_window
+            while len(alerts) < self._alert_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    alerts.append(self._alert_queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            try:
+                self._post_alert_batch(alerts)
+            except Exception as e:
+                logger.error("Failed to send alert batch: %s", e)
+            finally:
+                for _ in alerts:
+                    self._alert_queue.task_done()
+
+    def _post_alert_batch(self, alerts: List[tuple]):
+        """Post a batch of (level, message) alerts as one message"""
+        lines = [
+            f"{self._ALERT_EMOJI.get(level, 'ℹ️')} *Alert:* {message}"
+            for level, message in alerts
+        ]
+        if self._send_message(self.alerts_channel, "\n".join(lines)):
+            logger.info(
+                "Sent %d alert(s) to %s", len(alerts), self.alerts_channel
+            )
+        else:
+            logger.error("Failed to send alert to Slack")
     
     def _format_articles_summary(self, articles: List[Article], title: str) -> List[Dict]:
         """Format articles as Slack blocks"""
+        # _DIVIDER is shared between blocks: the SDK only serializes
+        # it, so one immutable dict serves every occurrence
         blocks = [
             {
                 "type": "header",
@@ -506,12 +530,14 @@ class AINewsSlackBot:
                     "text": title
                 }
             },
-            {
-                "type": "divider"
-            }
+            _DIVIDER
         ]
-        
+
         for article in articles:
+            source = article.source
+            language = article.language
+            published = article.published_date
+
             # Article block
             article_block = {
                 "type": "section",
@@ -520,16 +546,17 @@ class AINewsSlackBot:
                     "text": f"*<{article.url}|{article.title}>*\n{article.summary or 'No summary available'}"
                 }
             }
-            
+
             # Add metadata
-            metadata_text = []
-            if article.source:
-                metadata_text.append(f"📰 {article.source}")
-            if article.language:
-                metadata_text.append(f"🌐 {article.language}")
-            if article.published_date:
-                metadata_text.append(f"📅 {article.published_date.strftime('%Y-%m-%d')}")
-            
+            metadata_text = [
+                text for text, present in (
+                    (f"📰 {source}", source),
+                    (f"🌐 {language}", language),
+                    (f"📅 {_fmt_date(published) or ''}",
+                     published),
+                ) if present
+            ]
+
             if metadata_text:
                 article_block["fields"] = [
                     {
@@ -537,12 +564,13 @@ class AINewsSlackBot:
                         "text": " | ".join(metadata_text)
                     }
                 ]
-            
+
             blocks.append(article_block)
-            
+
             # Add tags if available
-            if article.tags:
-                tags_text = " ".join([f"`{tag}`" for tag in article.tags[:5]])
+            tags = article.tags
+            if tags:
+                tags_text = " ".join(f"`{tag}`" for tag in tags[:5])
                 blocks.append({
                     "type": "context",
                     "elements": [
@@ -552,50 +580,52 @@ class AINewsSlackBot:
                         }
                     ]
                 })
-            
-            blocks.append({"type": "divider"})
-        
+
+            blocks.append(_DIVIDER)
+
         return blocks
     
-    def _format_search_results(self, articles: List[Article], query: str) -> List[Dict]:
-        """Format search results as Slack blocks"""
-        return self._format_articles_summary(articles, f"Search Results for '{query}'")
-    
     def _send_message(self, channel: str, text: str) -> bool:
         """Send simple text message"""
-        try:
-            response = self.web_client.chat_postMessage(
-                channel=channel,
-                text=text
-            )
-            return response["ok"]
-        except Exception as e:
-            logger.error(f"Failed to send message: {e}")
-            return False
-    
+        return self._post_message(channel=channel, text=text)
+
     def _send_blocks(self, channel: str, blocks: List[Dict]) -> bool:
         """Send message with blocks"""
-        try:
-            response = self.web_client.chat_postMessage(
-                channel=channel,
-                text="AI News Update",  # Fallback text for accessibility
-                blocks=blocks
-            )
-            return response["ok"]
-        except Exception as e:
-            logger.error(f"Failed to send blocks: {e}")
-            return False
+        return self._post_message(
+            channel=channel,
+            text="AI News Update",  # Fallback text for accessibility
+            blocks=blocks
+        )
+
+    def _post_message(self, **kwargs) -> bool:
+        """chat.postMessage with one retry honoring a 429 Retry-After"""
+        for attempt in range(2):
+            try:
+                response = self.web_client.chat_postMessage(**kwargs)
+                return response["ok"]
+            except SlackApiError as e:
+                if attempt == 0 and e.response.status_code == 429:
+                    delay = int(e.response.headers.get('Retry-After', 1))
+                    logger.warning("Slack rate limited, retrying in %ds", delay)
+                    time.sleep(delay)
+                    continue
+                logger.error("Failed to send message: %s", e)
+                return False
+            except Exception as e:
+                logger.error("Failed to send message: %s", e)
+                return False
+        return False
     
     def test_connection(self) -> bool:
         """Test Slack connection"""
         try:
             response = self.web_client.auth_test()
             if response["ok"]:
-                logger.info(f"Slack connection successful. Bot user: {response['user']}")
+                logger.info("Slack connection successful. Bot user: %s", response['user'])
                 return True
             else:
                 logger.error("Slack connection failed")
                 return False
         except Exception as e:
-            logger.error(f"Slack connection test failed: {e}")
+            logger.error("Slack connection test failed: %s", e)
             return False
@@ -12,166 +12,197 @@ sys.path.append(str(Path(__file__).parent / 'src'))
 from src.database.models import DatabaseManager
 from src.utils.config import load_config
 from datetime import datetime
+from itertools import islice
 import json
 
-def view_database():
+
+def _fmt_dt(d, seconds=False):
+    """YYYY-MM-DD HH:MM[:SS] via f-string; skips strftime's per-call
+    format parsing and locale machinery"""
+    if d is None:
+        return 'Unknown'
+    base = f"{d.year:04d}-{d.month:02d}-{d.day:02d} {d.hour:02d}:{d.minute:02d}"
+    return f"{base}:{d.second:02d}" if seconds else base
+
+
+def _fmt_date(d):
+    """YYYY-MM-DD, 'Unknown' for missing dates"""
+    if d is None:
+        return 'Unknown'
+    return f"{d.year:04d}-{d.month:02d}-{d.day:02d}"
+
+
+def view_database(db: DatabaseManager):
     """View database contents"""
     try:
-        # Load configuration
-        config = load_config()
-        db_path = config.get('database', {}).get('path', 'data/ai_news.db')
-        
-        # Initialize database
-        db = DatabaseManager(db_path)
-        
-        print("🤖 AI News Slack Bot - Database Viewer")
-        print("=" * 50)
-        
-        # Show articles
-        print("\n📰 ARTICLES:")
-        articles = db.get_articles(limit=50)
-        
-        if not articles:
-            print("No articles found in database.")
+        # Build the whole report in memory and emit it with one write;
+        # per-line print() costs a lock + syscall each
+        out = []
+        out.append("🤖 AI News Slack Bot - Database Viewer\n")
+        out.append("=" * 50 + "\n")
+
+        # Show articles, streamed off the cursor (columnar projection:
+        # content is never read); the count line is backfilled once the
+        # total is known so the layout stays the same
+        out.append("\n📰 ARTICLES:\n")
+        header_pos = len(out)
+        count = 0
+
+        for article in db.iter_article_summaries(limit=50):
+            count += 1
+            out.append(f"{count}. {article.title}\n")
+            out.append(f"   Source: {article.source}\n")
+            out.append(f"   Language: {article.language}\n")
+            out.append(f"   Published: {_fmt_dt(article.published_date)}\n")
+            out.append(f"   URL: {article.url}\n")
+            if article.summary:
+                out.append(f"   Summary: {article.summary}...\n")
+            if article.tags:
+                out.append(f"   Tags: {', '.join(article.tags[:5])}\n")
+            out.append("\n")
+
+        if count:
+            out.insert(header_pos, f"Found {count} articles:\n\n")
         else:
-            print(f"Found {len(articles)} articles:\n")
-            
-            for i, article in enumerate(articles, 1):
-                print(f"{i}. {article.title}")
-                print(f"   Source: {article.source}")
-                print(f"   Language: {article.language}")
-                print(f"   Published: {article.published_date.strftime('%Y-%m-%d %H:%M') if article.published_date else 'Unknown'}")
-                print(f"   URL: {article.url}")
-                if article.summary:
-                    print(f"   Summary: {article.summary[:100]}...")
-                if article.tags:
-                    print(f"   Tags: {', '.join(article.tags[:5])}")
-                print()
-        
+            out.append("No articles found in database.\n")
+
         # Show sources
-        print("\n📡 NEWS SOURCES:")
+        out.append("\n📡 NEWS SOURCES:\n")
         sources = db.get_sources(enabled_only=False)
-        
+
         if sources:
             for source in sources:
                 status = "✅ Enabled" if source.enabled else "❌ Disabled"
-                print(f"• {source.name} ({source.source_type}) - {source.language} - {status}")
-                print(f"  URL: {source.url}")
+                out.append(f"• {source.name} ({source.source_type}) - {source.language} - {status}\n")
+                out.append(f"  URL: {source.url}\n")
                 if source.last_collected:
-                    print(f"  Last collected: {source.last_collected.strftime('%Y-%m-%d %H:%M')}")
-                print(f"  Collection count: {source.collection_count}, Errors: {source.error_count}")
-                print()
-        
+                    out.append(f"  Last collected: {_fmt_dt(source.last_collected)}\n")
+                out.append(f"  Collection count: {source.collection_count}, Errors: {source.error_count}\n")
+                out.append("\n")
+
         # Show tags
-        print("\n🏷️ TAGS:")
+        out.append("\n🏷️ TAGS:\n")
         tags = db.get_tags()
-        
+
         if tags:
             for tag in tags:
-                print(f"• {tag.name} ({tag.category}) - Used {tag.usage_count} times")
-        
+                out.append(f"• {tag.name} ({tag.category}) - Used {tag.usage_count} times\n")
+
         # Show statistics
-        print("\n📊 STATISTICS:")
+        out.append("\n📊 STATISTICS:\n")
         stats = db.get_collection_stats(days=7)
-        print(f"• Total articles (last 7 days): {stats['total_articles']}")
-        print(f"• Success rate: {stats['success_rate']}%")
-        
+        out.append(f"• Total articles (last 7 days): {stats['total_articles']}\n")
+        out.append(f"• Success rate: {stats['success_rate']}%\n")
+
         if stats['languages']:
-            print("• By language:")
+            out.append("• By language:\n")
             for lang, count in stats['languages'].items():
-                print(f"  - {lang}: {count}")
-        
+                out.append(f"  - {lang}: {count}\n")
+
         if stats['top_sources']:
-            print("• Top sources:")
-            for source, count in list(stats['top_sources'].items())[:5]:
-                print(f"  - {source}: {count}")
-        
+            out.append("• Top sources:\n")
+            # islice stops after 5 entries instead of materializing the
+            # whole items list just to slice it
+            for source, count in islice(stats['top_sources'].items(), 5):
+                out.append(f"  - {source}: {count}\n")
+
+        sys.stdout.write(''.join(out))
+
     except Exception as e:
         print(f"Error viewing database: {e}")
 
-def view_article_details(article_id: int):
+def view_article_details(db: DatabaseManager, article_id: int):
     """View detailed information about a specific article"""
     try:
-        config = load_config()
-        db_path = config.get('database', {}).get('path', 'data/ai_news.db')
-        db = DatabaseManager(db_path)
-        
-        # Get article by ID (we'll need to modify the database model for this)
-        articles = db.get_articles(limit=1000)  # Get all articles
-        
-        if article_id <= len(articles):
-            article = articles[article_id - 1]
-            
-            print(f"\n📰 ARTICLE DETAILS #{article_id}")
-            print("=" * 50)
-            print(f"Title: {article.title}")
-            print(f"Source: {article.source}")
-            print(f"Language: {article.language}")
-            print(f"Author: {article.author or 'Unknown'}")
-            print(f"Published: {article.published_date.strftime('%Y-%m-%d %H:%M:%S') if article.published_date else 'Unknown'}")
-            print(f"Collected: {article.collected_date.strftime('%Y-%m-%d %H:%M:%S') if article.collected_date else 'Unknown'}")
-            print(f"URL: {article.url}")
-            print(f"\nSummary:\n{article.summary}")
-            print(f"\nTags: {', '.join(article.tags) if article.tags else 'None'}")
-            print(f"\nContent:\n{article.content[:500]}{'...' if len(article.content) > 500 else ''}")
-            
+        # Single indexed row lookup instead of loading every article
+        article = db.get_article(article_id)
+
+        if article:
+            out = [
+                f"\n📰 ARTICLE DETAILS #{article_id}\n",
+                "=" * 50 + "\n",
+                f"Title: {article.title}\n",
+                f"Source: {article.source}\n",
+                f"Language: {article.language}\n",
+                f"Author: {article.author or 'Unknown'}\n",
+                f"Published: {_fmt_dt(article.published_date, seconds=True)}\n",
+                f"Collected: {_fmt_dt(article.collected_date, seconds=True)}\n",
+                f"URL: {article.url}\n",
+                f"\nSummary:\n{article.summary}\n",
+                f"\nTags: {', '.join(article.tags) if article.tags else 'None'}\n",
+                f"\nContent:\n{article.content[:500]}{'...' if len(article.content) > 500 else ''}\n",
+            ]
+
             if article.metadata:
-                print(f"\nMetadata:\n{json.dumps(article.metadata, indent=2)}")
+                out.append(f"\nMetadata:\n{json.dumps(article.metadata, indent=2)}\n")
+
+            sys.stdout.write(''.join(out))
         else:
-            print(f"Article #{article_id} not found. Available articles: 1-{len(articles)}")
+            print(f"Article #{article_id} not found.")
             
     except Exception as e:
         print(f"Error viewing article details: {e}")
 
-def search_articles(query: str):
+def search_articles(db: DatabaseManager, query: str):
     """Search articles by keyword"""
     try:
-        config = load_config()
-        db_path = config.get('database', {}).get('path', 'data/ai_news.db')
-        db = DatabaseManager(db_path)
-        
-        articles = db.search_articles(query, limit=20)
-        
-        print(f"\n🔍 SEARCH RESULTS for '{query}':")
-        print("=" * 50)
-        
-        if not articles:
-            print("No articles found matching your search.")
+        # Column-projected search: only the displayed fields are read,
+        # skipping content/tags/metadata hydration per row
+        results = db.search_article_summaries(query, limit=20)
+
+        out = [
+            f"\n🔍 SEARCH RESULTS for '{query}':\n",
+            "=" * 50 + "\n",
+        ]
+
+        if not results:
+            out.append("No articles found matching your search.\n")
         else:
-            print(f"Found {len(articles)} articles:\n")
-            
-            for i, article in enumerate(articles, 1):
-                print(f"{i}. {article.title}")
-                print(f"   Source: {article.source} | Language: {article.language}")
-                print(f"   Published: {article.published_date.strftime('%Y-%m-%d') if article.published_date else 'Unknown'}")
-                if article.summary:
-                    print(f"   Summary: {article.summary[:150]}...")
-                print()
-                
+            out.append(f"Found {len(results)} articles:\n\n")
+
+            for i, (title, source, language, published, summary) in enumerate(results, 1):
+                out.append(f"{i}. {title}\n")
+                out.append(f"   Source: {source} | Language: {language}\n")
+                out.append(f"   Published: {_fmt_date(published)}\n")
+                if summary:
+                    out.append(f"   Summary: {summary}...\n")
+                out.append("\n")
+
+        sys.stdout.write(''.join(out))
+
+
     except Exception as e:
         print(f"Error searching articles: {e}")
 
 def main():
     """Main function with interactive menu"""
-    if len(sys.argv) > 1:
-        command = sys.argv[1].lower()
-        
-        if command == "search" and len(sys.argv) > 2:
-            query = " ".join(sys.argv[2:])
-            search_articles(query)
-        elif command == "article" and len(sys.argv) > 2:
-            try:
-                article_id = int(sys.argv[2])
-                view_article_details(article_id)
-            except ValueError:
-                print("Please provide a valid article number.")
+    # One config load + DatabaseManager shared by every subcommand
+    config = load_config()
+    db_path = config.get('database', {}).get('path', 'data/ai_news.db')
+    db = DatabaseManager(db_path)
+
+    try:
+        if len(sys.argv) > 1:
+            command = sys.argv[1].lower()
+
+            if command == "search" and len(sys.argv) > 2:
+                query = " ".join(sys.argv[2:])
+                search_articles(db, query)
+            elif command == "article" and len(sys.argv) > 2:
+                try:
+                    article_id = int(sys.argv[2])
+                    view_article_details(db, article_id)
+                except ValueError:
+                    print("Please provide a valid article number.")
+            else:
+                print("Usage:")
+                print("  python3 view_database.py                    # View all data")
+                print("  python3 view_database.py search <keyword>   # Search articles")
+                print("  python3 view_database.py article <number>   # View specific article")
         else:
-            print("Usage:")
-            print("  python3 view_database.py                    # View all data")
-            print("  python3 view_database.py search <keyword>   # Search articles")
-            print("  python3 view_database.py article <number>   # View specific article")
-    else:
-        view_database()
+            view_database(db)
+    finally:
+        db.close()
 
 if __name__ == "__main__":
     main()